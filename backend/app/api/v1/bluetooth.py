@@ -1,21 +1,26 @@
 """
 Bluetooth API using direct Bleak scanner
 
-Uses Bleak's BleakScanner to directly scan for BLE devices via host Bluetooth adapter.
-Filters by SFP Wizard service UUID: 8e60f02e-f699-4865-b83f-f40501752184
+Uses a background BleakScanner (see BLEScannerService) to scan for BLE devices via
+the host Bluetooth adapter. Filters by SFP Wizard service UUID:
+8e60f02e-f699-4865-b83f-f40501752184
 """
 
-import base64
 import hashlib
+from contextlib import AbstractAsyncContextManager, nullcontext
+
 import structlog
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
-from typing import Any, List
-from bleak import BleakScanner
+from datetime import datetime
+from typing import List, NoReturn
 
-from app.services.ble_operations import BLEOperationsService
+from app.services.ble_operations import BLEOperationsService, EEPROMVerificationError
+from app.services.ble_scanner import BLEScannerService
 from app.services.sfp_parser import parse_sfp_data
 from app.repositories.module_repository import ModuleRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.core.database import get_db
 from app.config import get_settings
 
@@ -23,6 +28,9 @@ logger = structlog.get_logger(__name__)
 router = APIRouter(prefix="/bluetooth", tags=["bluetooth"])
 settings = get_settings()
 
+# Global scanner instance (registered in main.py lifespan)
+_ble_scanner: BLEScannerService | None = None
+
 
 # ====================================================================
 # Constants
@@ -31,6 +39,53 @@ settings = get_settings()
 # SFP Wizard service UUID (firmware v1.0.10)
 SFP_SERVICE_UUID = settings.sfp_service_uuid
 
+# Lowercased once for O(1) membership tests against advertised UUIDs
+KNOWN_SFP_SERVICE_UUIDS = frozenset({SFP_SERVICE_UUID.lower()})
+
+
+def _raise_duplicate(module_id: int, sha256: str) -> NoReturn:
+    """Reject a read whose EEPROM data is already saved as module_id."""
+    logger.warning("duplicate_module_detected", existing_id=module_id, sha256=sha256[:16])
+    raise HTTPException(
+        status_code=409,
+        detail=f"Module already exists in library (ID: {module_id}). "
+        f"This exact EEPROM data was previously saved."
+    )
+
+
+def set_ble_scanner(scanner: BLEScannerService | None) -> None:
+    """Set the global background BLE scanner instance."""
+    global _ble_scanner
+    _ble_scanner = scanner
+
+
+async def get_ble_scanner() -> BLEScannerService:
+    """
+    Dependency to get the background BLE scanner.
+
+    Starts it on demand if it is not running yet, e.g. because the Bluetooth
+    adapter was not ready when the application started.
+    """
+    if _ble_scanner is None:
+        raise HTTPException(status_code=503, detail="BLE scanner not available.")
+    if not _ble_scanner.is_running:
+        try:
+            await _ble_scanner.start()
+        except Exception as e:
+            logger.error("ble_scanner_start_failed", error=str(e))
+            raise HTTPException(
+                status_code=503,
+                detail="BLE scanner not running. Check that a Bluetooth adapter is available.",
+            ) from e
+    return _ble_scanner
+
+
+def _scanner_paused() -> AbstractAsyncContextManager[None]:
+    """Pause background scanning while a device connection is in use."""
+    if _ble_scanner is None:
+        return nullcontext()
+    return _ble_scanner.paused()
+
 
 # ====================================================================
 # Request/Response Models
@@ -51,16 +106,45 @@ class WriteRequest(BaseModel):
     verify: bool = True
 
 
+class ModuleResponse(BaseModel):
+    id: int
+    name: str
+    vendor: str | None
+    model: str | None
+    serial: str | None
+    sha256: str
+    created_at: datetime | None
+
+    class Config:
+        """Pydantic configuration."""
+
+        from_attributes = True
+
+
+class WriteResponse(BaseModel):
+    success: bool
+    module_id: int
+    module_name: str
+    vendor: str | None
+    model: str | None
+    serial: str | None
+    verified: bool
+    verification_status: str
+
+
 # ====================================================================
 # Endpoints
 # ====================================================================
 
 @router.get("/discover")
-async def discover_devices() -> DiscoverResponse:
+async def discover_devices(
+    scanner: BLEScannerService = Depends(get_ble_scanner),
+) -> DiscoverResponse:
     """
     Discover SFP Wizard devices via direct BLE scanning.
 
-    Uses Bleak's BleakScanner to scan for devices advertising the SFP Wizard
+    Returns a snapshot of the background BleakScanner's advertisement cache,
+    filtered to recently seen devices advertising the SFP Wizard
     service UUID: 8e60f02e-f699-4865-b83f-f40501752184
 
     Returns:
@@ -69,34 +153,27 @@ async def discover_devices() -> DiscoverResponse:
     try:
         logger.info("ble_scan_start", service_uuid=SFP_SERVICE_UUID)
 
-        # Scan for 10 seconds
-        discovered_devices = await BleakScanner.discover(
-            timeout=10.0,
-            return_adv=True  # Return advertisement data
-        )
-
         # Filter by service UUID
-        devices = []
-        for address, (device, advertisement_data) in discovered_devices.items():
-            # Check if device advertises our service UUID
-            service_uuids = advertisement_data.service_uuids or []
-
-            if SFP_SERVICE_UUID.lower() in [str(uuid).lower() for uuid in service_uuids]:
-                devices.append({
-                    "address": address,
-                    "name": device.name or address,  # Fallback to MAC if no name
-                    "rssi": advertisement_data.rssi,
-                    "source": "direct_scan",
-                    "last_seen": None
-                })
-                logger.info(
-                    "sfp_wizard_discovered",
-                    address=address,
-                    name=device.name,
-                    rssi=advertisement_data.rssi
-                )
-
-        logger.info("ble_scan_complete", devices_found=len(devices))
+        devices = [
+            {
+                "address": device.address,
+                "name": device.name or device.address,  # Fallback to MAC if no name
+                "rssi": advertisement_data.rssi,
+                "source": "direct_scan",
+                "last_seen": None,
+            }
+            for device, advertisement_data in scanner.get_recent_devices()
+            if any(
+                uuid.lower() in KNOWN_SFP_SERVICE_UUIDS
+                for uuid in (advertisement_data.service_uuids or ())
+            )
+        ]
+
+        logger.info(
+            "ble_scan_complete",
+            devices_found=len(devices),
+            addresses=[device["address"] for device in devices],
+        )
         return DiscoverResponse(devices=devices)
 
     except Exception as e:
@@ -108,7 +185,9 @@ async def discover_devices() -> DiscoverResponse:
 
 
 @router.post("/read")
-async def read_module(request: ReadRequest) -> dict[str, Any]:
+async def read_module(
+    request: ReadRequest, db: AsyncSession = Depends(get_db)
+) -> ModuleResponse:
     """
     Read EEPROM from SFP module via SFP Wizard.
 
@@ -130,52 +209,41 @@ async def read_module(request: ReadRequest) -> dict[str, Any]:
     logger.info("read_module_start", device=request.device_address, name=request.name)
 
     try:
-        # Step 1: Connect and read EEPROM
-        async with BLEOperationsService(request.device_address) as ble:
-            eeprom_data = await ble.read_eeprom()
-
-        # Step 2: Parse SFF-8472 data
+        # Step 1: Connect and read EEPROM, hashing chunks as they arrive
+        hasher = hashlib.sha256()
+        async with _scanner_paused(), BLEOperationsService(request.device_address) as ble:
+            # Immutable bytes, stored in the database as-is
+            eeprom_data = await ble.read_eeprom(on_chunk=hasher.update)
+        sha256 = hasher.hexdigest()
+
+        # Step 2: Check for a duplicate before parsing; re-reading a module
+        # that is already in the library is the common case
+        repo = ModuleRepository(db)
+        existing = await repo.get_by_sha256(sha256)
+        if existing:
+            _raise_duplicate(existing.id, sha256)
+
+        # Step 3: Parse SFF-8472 data
         parsed = parse_sfp_data(eeprom_data)
         logger.info("module_parsed", vendor=parsed.get("vendor"), model=parsed.get("model"))
 
-        # Step 3: Calculate SHA256 hash
-        sha256 = hashlib.sha256(eeprom_data).hexdigest()
-
-        # Step 4: Save to database
-        async for db in get_db():
-            repo = ModuleRepository(db)
-
-            # Check for duplicates
-            existing = await repo.get_by_sha256(sha256)
-            if existing:
-                logger.warning("duplicate_module_detected", existing_id=existing.id, sha256=sha256[:16])
-                raise HTTPException(
-                    status_code=409,
-                    detail=f"Module already exists in library (ID: {existing.id}). "
-                    f"This exact EEPROM data was previously saved."
-                )
-
-            # Create module
-            module = await repo.create(
-                name=request.name,
-                vendor=parsed["vendor"],
-                model=parsed["model"],
-                serial=parsed["serial"],
-                eeprom_data=base64.b64encode(eeprom_data).decode("utf-8"),
-                sha256=sha256,
-            )
+        # Step 4: Save to database; the insert still skips a duplicate saved
+        # concurrently since the check above
+        module, created = await repo.create_if_absent(
+            name=request.name,
+            vendor=parsed["vendor"],
+            model=parsed["model"],
+            serial=parsed["serial"],
+            eeprom_data=eeprom_data,
+            sha256=sha256,
+        )
+        if not created:
+            _raise_duplicate(module.id, sha256)
+        await db.commit()
 
-            logger.info("module_saved", module_id=module.id, name=module.name)
+        logger.info("module_saved", module_id=module.id, name=module.name)
 
-            return {
-                "id": module.id,
-                "name": module.name,
-                "vendor": module.vendor,
-                "model": module.model,
-                "serial": module.serial,
-                "sha256": module.sha256,
-                "created_at": module.created_at.isoformat() if module.created_at else None,
-            }
+        return ModuleResponse.model_validate(module)
 
     except HTTPException:
         raise
@@ -191,7 +259,9 @@ async def read_module(request: ReadRequest) -> dict[str, Any]:
 
 
 @router.post("/write")
-async def write_module(request: WriteRequest) -> dict[str, Any]:
+async def write_module(
+    request: WriteRequest, db: AsyncSession = Depends(get_db)
+) -> WriteResponse:
     """
     Write EEPROM to SFP module via SFP Wizard.
 
@@ -221,59 +291,56 @@ async def write_module(request: WriteRequest) -> dict[str, Any]:
 
     try:
         # Step 1: Get module from database
-        async for db in get_db():
-            repo = ModuleRepository(db)
-            module = await repo.get_by_id(request.module_id)
-
-            if not module:
-                raise HTTPException(
-                    status_code=404, detail=f"Module {request.module_id} not found"
-                )
-
-            # Decode EEPROM data
-            eeprom_data = base64.b64decode(module.eeprom_data)
-
-            if len(eeprom_data) != 256:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid EEPROM data length: {len(eeprom_data)} bytes "
-                    "(expected 256)",
-                )
-
-            logger.info(
-                "write_module_details",
-                vendor=module.vendor,
-                model=module.model,
-                serial=module.serial,
+        repo = ModuleRepository(db)
+        module = await repo.get_write_payload(request.module_id)
+
+        if not module:
+            raise HTTPException(
+                status_code=404, detail=f"Module {request.module_id} not found"
             )
 
-            # Step 2: Connect and write
-            async with BLEOperationsService(request.device_address) as ble:
-                # Write with built-in verification if requested
-                success = await ble.write_eeprom(eeprom_data, verify=request.verify)
-
-            result = {
-                "success": success,
-                "module_id": module.id,
-                "module_name": module.name,
-                "vendor": module.vendor,
-                "model": module.model,
-                "serial": module.serial,
-                "verified": request.verify,
-            }
+        # EEPROM data is stored as raw bytes (BLOB column). Its length is
+        # enforced on insert (eeprom_256_bytes constraint); write_eeprom()
+        # still rejects rows saved before the constraint existed.
+        eeprom_data = module.eeprom_data
+
+        logger.info(
+            "write_module_details",
+            vendor=module.vendor,
+            model=module.model,
+            serial=module.serial,
+        )
 
-            if request.verify:
-                result["verification_status"] = "passed"
-                logger.info("write_verified", module_id=module.id)
-            else:
-                result["verification_status"] = "skipped"
-                logger.warning(
-                    "write_unverified",
-                    module_id=module.id,
-                    message="Write completed without verification",
-                )
+        # Release the session (and its pooled connection) before the BLE write,
+        # which can take several seconds; the fetched row is plain data.
+        await db.close()
+
+        # Step 2: Connect and write
+        async with _scanner_paused(), BLEOperationsService(request.device_address) as ble:
+            # Write with built-in verification if requested
+            success = await ble.write_eeprom(eeprom_data, verify=request.verify)
+
+        if request.verify:
+            verification_status = "passed"
+            logger.info("write_verified", module_id=module.id)
+        else:
+            verification_status = "skipped"
+            logger.warning(
+                "write_unverified",
+                module_id=module.id,
+                message="Write completed without verification",
+            )
 
-            return result
+        return WriteResponse(
+            success=success,
+            module_id=module.id,
+            module_name=module.name,
+            vendor=module.vendor,
+            model=module.model,
+            serial=module.serial,
+            verified=request.verify,
+            verification_status=verification_status,
+        )
 
     except HTTPException:
         raise
@@ -283,6 +350,20 @@ async def write_module(request: WriteRequest) -> dict[str, Any]:
     except TimeoutError as e:
         logger.error("write_timeout", device=request.device_address, error=str(e))
         raise HTTPException(status_code=504, detail=f"Operation timed out: {str(e)}")
+    except ValueError as e:
+        logger.error("write_invalid_eeprom", module_id=request.module_id, error=str(e))
+        raise HTTPException(status_code=400, detail=f"Invalid EEPROM data: {str(e)}") from e
+    except EEPROMVerificationError as e:
+        logger.error(
+            "write_verification_failed",
+            device=request.device_address,
+            diff_offsets=e.diff_offsets,
+        )
+        raise HTTPException(
+            status_code=500,
+            detail=f"Write verification failed: {len(e.diff_offsets)} bytes differ "
+            f"at offsets {e.diff_offsets}. Module may be corrupted! Do NOT use this module.",
+        ) from e
     except RuntimeError as e:
         # Verification failure
         logger.error("write_verification_failed", device=request.device_address, error=str(e))
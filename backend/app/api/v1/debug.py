@@ -12,8 +12,11 @@ Set PYTHONPATH=/path/to/tools in the environment before starting the backend.
 """
 
 import asyncio
-import json
+import os
+from collections import defaultdict
 from pathlib import Path
+
+import orjson
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
@@ -36,6 +39,73 @@ REPORTS_DIR = Path(__file__).parents[4] / "tools" / "ble_exploration" / "reports
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 LOG_FILE = REPORTS_DIR / "ha_debug.jsonl"
 
+# Append-only index of LOG_FILE: event_type -> [(offset, length), ...].
+# The log only grows, so each call indexes just the bytes appended since the
+# previous call instead of re-parsing the whole file. The inode detects the
+# log being rotated (replaced by a new file) rather than appended to.
+_log_offset = 0
+_log_inode: int | None = None
+_log_index: dict[str, list[tuple[int, int]]] = defaultdict(list)
+_log_index_lock = asyncio.Lock()
+
+
+def _update_log_index() -> None:
+    """Index log lines appended since the last call (runs in thread pool)."""
+    global _log_offset, _log_inode
+
+    try:
+        stat = LOG_FILE.stat()
+        size, inode = stat.st_size, stat.st_ino
+    except FileNotFoundError:
+        size, inode = 0, None
+
+    if size < _log_offset or inode != _log_inode:
+        # Log was truncated or replaced; rebuild the index from scratch
+        _log_index.clear()
+        _log_offset = 0
+        _log_inode = inode
+
+    if size == _log_offset:
+        return
+
+    offset = _log_offset
+    with open(LOG_FILE, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                # Partially written line; pick it up on the next call
+                break
+            try:
+                event_type = orjson.loads(line)['event_type']
+            except (orjson.JSONDecodeError, KeyError, TypeError):
+                event_type = None
+            if event_type is not None:
+                _log_index[event_type].append((offset, len(line)))
+            offset += len(line)
+
+    _log_offset = offset
+
+
+def _read_log_entries(event_type: str) -> list[dict[str, Any]]:
+    """Update the index and read all entries of one event type (runs in thread pool)."""
+    _update_log_index()
+
+    spans = _log_index.get(event_type)
+    if not spans:
+        return []
+
+    fd = os.open(LOG_FILE, os.O_RDONLY)
+    try:
+        return [orjson.loads(os.pread(fd, length, offset)) for offset, length in spans]
+    finally:
+        os.close(fd)
+
+
+async def _get_log_entries(event_type: str) -> list[dict[str, Any]]:
+    """Return logged entries of the given event type, oldest first."""
+    async with _log_index_lock:
+        return await asyncio.to_thread(_read_log_entries, event_type)
+
 
 # ====================================================================
 # Request/Response Models
@@ -77,28 +147,15 @@ async def discover_services(request: DiscoverServicesRequest):
         try:
             await explorer.discover_services()
         finally:
-            explorer.log_handle.close()
+            await explorer.close()
 
         # Parse log to extract service info
-        services = []
-        service_count = 0
-
-        def _parse_log():
-            nonlocal service_count
-            result = []
-            with open(LOG_FILE, 'r') as f:
-                for line in f:
-                    entry = json.loads(line)
-                    if entry['event_type'] == 'service_discovered':
-                        result.append(entry['data'])
-                        service_count += 1
-            return result
-        
-        services = await asyncio.to_thread(_parse_log)
+        entries = await _get_log_entries('service_discovered')
+        services = [entry['data'] for entry in entries]
 
         return {
             "success": True,
-            "service_count": service_count,
+            "service_count": len(services),
             "services": services
         }
 
@@ -123,24 +180,12 @@ async def test_writes(request: TestWritesRequest):
         try:
             await explorer.test_write_patterns(patterns)
         finally:
-            explorer.log_handle.close()
+            await explorer.close()
 
         # Parse log to count successes/failures
-        successful = 0
-        failed = 0
-
-        def _parse_log():
-            nonlocal successful, failed
-            with open(LOG_FILE, 'r') as f:
-                for line in f:
-                    entry = json.loads(line)
-                    if entry['event_type'] == 'write_test':
-                        if entry['data'].get('success'):
-                            successful += 1
-                        else:
-                            failed += 1
-        
-        await asyncio.to_thread(_parse_log)
+        entries = await _get_log_entries('write_test')
+        successful = sum(1 for entry in entries if entry['data'].get('success'))
+        failed = len(entries) - successful
 
         return {
             "success": True,
@@ -168,22 +213,11 @@ async def monitor_notifications(request: MonitorNotificationsRequest):
         try:
             await explorer.monitor_notifications(request.duration)
         finally:
-            explorer.log_handle.close()
-
-        # Parse log to extract notifications
-        notifications = []
-
-        def _parse_log():
-            result = []
-            with open(LOG_FILE, 'r') as f:
-                for line in f:
-                    entry = json.loads(line)
-                    if entry['event_type'] == 'monitoring_complete':
-                        result = entry['data']['notifications']
-                        break
-            return result
-        
-        notifications = await asyncio.to_thread(_parse_log)
+            await explorer.close()
+
+        # Parse log to extract notifications from the latest monitoring run
+        entries = await _get_log_entries('monitoring_complete')
+        notifications = entries[-1]['data']['notifications'] if entries else []
 
         return {
             "success": True,
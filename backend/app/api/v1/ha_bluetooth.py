@@ -46,11 +46,9 @@ async def get_status(
     Returns information about the connection to HA and discovered devices.
     """
     try:
-        devices = await client.get_bluetooth_devices()
-
         return HABluetoothStatus(
             enabled=True,
-            devices_discovered=len(devices),
+            devices_discovered=client.device_count,
             ha_api_url=client.ha_api_url,
             connected=client.is_connected,
         )
@@ -62,7 +60,7 @@ async def get_status(
 @router.get("/devices", response_model=list[HABluetoothDevice])
 async def get_devices(
     client: HomeAssistantBluetoothClient = Depends(get_ha_bluetooth_client)
-) -> list[HABluetoothDevice]:
+) -> tuple[HABluetoothDevice, ...]:
     """
     Get auto-discovered Bluetooth devices from Home Assistant.
 
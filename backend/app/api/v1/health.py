@@ -1,6 +1,7 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 from app.config import get_settings
 
@@ -8,36 +9,44 @@ router = APIRouter()
 settings = get_settings()
 
 
+# Responses never change while the process runs; serialize them once
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "version": settings.version})
+_ROOT_BYTES = orjson.dumps({
+    "name": settings.project_name,
+    "version": settings.version,
+    "docs_url": f"{settings.api_v1_prefix}/docs",
+})
+
+
 @router.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """Health check endpoint for monitoring."""
-    return {"status": "healthy", "version": settings.version}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @router.get("/")
-async def root() -> dict[str, str]:
+async def root() -> Response:
     """Root endpoint with API information."""
-    return {
-        "name": settings.project_name,
-        "version": settings.version,
-        "docs_url": f"{settings.api_v1_prefix}/docs",
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
+
+
+_CONFIG_BYTES = orjson.dumps({
+    "version": settings.version,
+    "device_name_patterns": settings.device_name_patterns,
+    "auto_discover": settings.auto_discover,
+    "enable_debug_ble": settings.enable_debug_ble,
+    "ble_trace_logging": settings.ble_trace_logging,
+    "enable_debug_tools": settings.enable_debug_tools,
+    "scan_interval": settings.scan_interval,
+    "rssi_threshold": settings.rssi_threshold,
+    "connection_timeout": settings.connection_timeout,
+    "sfp_service_uuid": settings.sfp_service_uuid,
+    "sfp_write_char_uuid": settings.sfp_write_char_uuid,
+    "sfp_notify_char_uuid": settings.sfp_notify_char_uuid,
+})
 
 
 @router.get("/config")
-async def app_config() -> dict[str, object]:
+async def app_config() -> Response:
     """Expose runtime configuration for the frontend."""
-    return {
-        "version": settings.version,
-        "device_name_patterns": settings.device_name_patterns,
-        "auto_discover": settings.auto_discover,
-        "enable_debug_ble": settings.enable_debug_ble,
-        "ble_trace_logging": settings.ble_trace_logging,
-        "enable_debug_tools": settings.enable_debug_tools,
-        "scan_interval": settings.scan_interval,
-        "rssi_threshold": settings.rssi_threshold,
-        "connection_timeout": settings.connection_timeout,
-        "sfp_service_uuid": settings.sfp_service_uuid,
-        "sfp_write_char_uuid": settings.sfp_write_char_uuid,
-        "sfp_notify_char_uuid": settings.sfp_notify_char_uuid,
-    }
+    return Response(content=_CONFIG_BYTES, media_type="application/json")
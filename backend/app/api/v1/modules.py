@@ -1,6 +1,6 @@
 """API endpoints for SFP modules."""
 
-import base64
+from binascii import a2b_base64
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Response
@@ -38,15 +38,19 @@ async def create_module(
     Duplicate detection is performed using SHA-256 checksum.
     """
     try:
-        eeprom_data = base64.b64decode(module.eeprom_data_base64)
+        eeprom_data = a2b_base64(module.eeprom_data_base64)
     except Exception as e:
         logger.warning("invalid_base64_data", error=str(e))
         raise HTTPException(status_code=400, detail="Invalid Base64 data") from e
 
     service = ModuleService(db)
-    created_module, is_duplicate = await service.add_module(
-        name=module.name, eeprom_data=eeprom_data
-    )
+    try:
+        created_module, is_duplicate = await service.add_module(
+            name=module.name, eeprom_data=eeprom_data
+        )
+    except ValueError as e:
+        logger.warning("invalid_eeprom_size", size=len(eeprom_data))
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     logger.info(
         "module_saved",
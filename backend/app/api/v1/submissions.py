@@ -1,17 +1,18 @@
 """API endpoints for community submissions."""
 
 import asyncio
-import base64
-import hashlib
-import json
+import binascii
 import os
-import uuid
-from datetime import datetime
+import shutil
+from datetime import UTC, datetime
 
+import orjson
 import structlog
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 
 from app.config import get_settings
+from app.core.hashing import sha256_hex
+from app.core.rate_limit import limiter
 from app.schemas.submission import SubmissionCreate, SubmissionResponse
 
 router = APIRouter()
@@ -20,48 +21,43 @@ settings = get_settings()
 
 
 @router.post("/submissions", response_model=SubmissionResponse)
-async def submit_to_community(payload: SubmissionCreate) -> SubmissionResponse:
+@limiter.limit(settings.submissions_rate_limit)
+async def submit_to_community(request: Request, payload: SubmissionCreate) -> SubmissionResponse:
     """
     Accept a community submission without GitHub sign-in.
 
     Submissions are stored in an inbox for maintainers to review and publish.
-    
-    Note: Uses asyncio.to_thread for file I/O to avoid blocking the event loop.
-    """
-    try:
-        eeprom = base64.b64decode(payload.eeprom_data_base64)
-    except Exception as e:
-        logger.warning("invalid_submission_base64", error=str(e))
-        raise HTTPException(status_code=400, detail="Invalid Base64 data") from e
+    Rate limited per client (submissions_rate_limit; per HA user behind
+    ingress) so excess requests get a 429 before the handler runs. The JSON
+    body has been parsed and validated by then, but the Base64 data is not
+    yet decoded and nothing is written to disk.
 
-    sha = hashlib.sha256(eeprom).hexdigest()
+    Note: Base64 decoding, hashing and file I/O run via asyncio.to_thread to
+    avoid blocking the event loop.
+    """
     inbox_root = settings.submissions_dir
-    
-    # Run blocking I/O operations in thread pool
-    await asyncio.to_thread(os.makedirs, inbox_root, exist_ok=True)
-
-    inbox_id = str(uuid.uuid4())
-    target_dir = os.path.join(inbox_root, inbox_id)
-    await asyncio.to_thread(os.makedirs, target_dir, exist_ok=True)
+    inbox_id = os.urandom(16).hex()
 
-    # Write EEPROM binary
-    eeprom_path = os.path.join(target_dir, "eeprom.bin")
-    await asyncio.to_thread(_write_binary_file, eeprom_path, eeprom)
-
-    # Write metadata JSON
     metadata = {
         "name": payload.name,
         "vendor": payload.vendor,
         "model": payload.model,
         "serial": payload.serial,
-        "sha256": sha,
+        "sha256": None,  # Filled in by _persist_submission
         "notes": payload.notes,
-        "created_at": datetime.utcnow().isoformat() + "Z",
+        "created_at": datetime.now(UTC),
     }
-    metadata_path = os.path.join(target_dir, "metadata.json")
-    await asyncio.to_thread(_write_json_file, metadata_path, metadata)
 
-    logger.info("submission_queued", inbox_id=inbox_id, sha256=sha[:16] + "...")
+    # Decode, hash and write in a single thread pool hop, off the event loop
+    try:
+        sha = await asyncio.to_thread(
+            _persist_submission, inbox_root, inbox_id, payload.eeprom_data_base64, metadata
+        )
+    except binascii.Error as e:
+        logger.warning("invalid_submission_base64", error=str(e))
+        raise HTTPException(status_code=400, detail="Invalid Base64 data") from e
+
+    logger.info("submission_queued", inbox_id=inbox_id, sha256_prefix=sha[:16])
 
     return SubmissionResponse(
         status="queued",
@@ -71,13 +67,74 @@ async def submit_to_community(payload: SubmissionCreate) -> SubmissionResponse:
     )
 
 
-def _write_binary_file(path: str, data: bytes) -> None:
-    """Helper to write binary file (runs in thread pool)."""
-    with open(path, "wb") as f:
-        f.write(data)
+def _persist_submission(
+    inbox_root: str, inbox_id: str, eeprom_base64: str, metadata: dict
+) -> str:
+    """
+    Decode, hash and write a submission into the inbox atomically (runs in thread pool).
 
+    Files are written into a hidden staging directory which is then renamed
+    to its final name, so reviewers never see a half-written entry.
 
-def _write_json_file(path: str, data: dict) -> None:
-    """Helper to write JSON file (runs in thread pool)."""
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    Returns:
+        SHA-256 hex digest of the decoded EEPROM data
+
+    Raises:
+        binascii.Error: If eeprom_base64 is not valid Base64
+    """
+    try:
+        eeprom = binascii.a2b_base64(eeprom_base64)
+    except ValueError as e:
+        # Non-ASCII input raises a plain ValueError
+        raise binascii.Error(str(e)) from e
+    sha = sha256_hex(eeprom)
+    metadata["sha256"] = sha
+
+    staging_dir = os.path.join(inbox_root, f".{inbox_id}.tmp")
+    try:
+        # inbox_root is created at startup; inbox_id is unique per submission
+        os.mkdir(staging_dir)
+    except FileNotFoundError:
+        # inbox_root was removed while running
+        os.makedirs(staging_dir)
+
+    try:
+        dir_fd = os.open(staging_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            _write_file_at(dir_fd, "eeprom.bin", eeprom)
+            _write_file_at(
+                dir_fd,
+                "metadata.json",
+                orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_UTC_Z),
+            )
+            # The files' directory entries must be on disk before the rename
+            # publishes them
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+        os.rename(staging_dir, os.path.join(inbox_root, inbox_id))
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+
+    # Make the rename itself durable
+    root_fd = os.open(inbox_root, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(root_fd)
+    finally:
+        os.close(root_fd)
+
+    return sha
+
+
+def _write_file_at(dir_fd: int, name: str, data: bytes) -> None:
+    """Create a file relative to dir_fd, write data and fsync it."""
+    fd = os.open(name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dir_fd)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -2,10 +2,10 @@
 
 import json
 import os
-from functools import lru_cache
+from typing import Annotated
 
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -32,6 +32,7 @@ class Settings(BaseSettings):
 
     # Submissions - default to persistent HA config path
     submissions_dir: str = "/config/sfplib/submissions"
+    submissions_rate_limit: str = "10/minute"  # Per client (HA user behind ingress)
 
     # Logging
     log_level: str = "INFO"
@@ -41,7 +42,8 @@ class Settings(BaseSettings):
     ha_api_url: str = "http://supervisor/core/api"
     ha_ws_url: str = "ws://supervisor/core/websocket"
     supervisor_token: str = Field(default_factory=lambda: os.getenv("SUPERVISOR_TOKEN", ""))
-    device_name_patterns: list[str] = ["SFP", "Wizard"]
+    # NoDecode: the raw env string goes to parse_patterns, which accepts more than JSON
+    device_name_patterns: Annotated[tuple[str, ...], NoDecode] = ("SFP", "Wizard")
     auto_discover: bool = True
     connection_timeout: int = 30
     device_expiry_seconds: int = 300
@@ -49,13 +51,28 @@ class Settings(BaseSettings):
     @field_validator('device_name_patterns', mode='before')
     @classmethod
     def parse_patterns(cls, v):
-        """Parse device_name_patterns from JSON string if needed."""
+        """
+        Freeze device_name_patterns to a tuple.
+
+        Strings are read as a JSON list ('["SFP", "Wizard"]'), a JSON string
+        ('"SFP"') or comma-separated names ("SFP, Wizard"); a single name is
+        one pattern, never split into characters.
+        """
         if isinstance(v, str):
             try:
-                return json.loads(v)
-            except (json.JSONDecodeError, TypeError):
-                return ["SFP", "Wizard"]
-        return v
+                v = json.loads(v)
+            except json.JSONDecodeError:
+                v = [name.strip() for name in v.split(",") if name.strip()]
+                if not v:
+                    return ("SFP", "Wizard")
+        if isinstance(v, str):
+            return (v,)
+        if not isinstance(v, list | tuple):
+            raise ValueError(
+                "device_name_patterns must be a name, a comma-separated list of "
+                f"names or a JSON list of names, got {type(v).__name__}"
+            )
+        return tuple(v)
 
     # SFP Wizard BLE Service UUIDs (firmware v1.0.10)
     sfp_service_uuid: str = "8E60F02E-F699-4865-B83F-F40501752184"
@@ -81,7 +98,10 @@ class Settings(BaseSettings):
     database_backup_path: str = "/config/sfplib/backups"  # Backup directory
 
 
-@lru_cache
+# Settings are read from the environment once, at import
+SETTINGS = Settings()
+
+
 def get_settings() -> Settings:
-    """Cached settings instance."""
-    return Settings()
+    """Shared settings instance."""
+    return SETTINGS
@@ -1,13 +1,28 @@
 """Database configuration and session management."""
 
 from collections.abc import AsyncGenerator
+from pathlib import Path
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import Connection, event, inspect
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.config import get_settings
 
 settings = get_settings()
 
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+# Revision matching the schema of databases that predate migrations
+BASELINE_REVISION = "b7e3c1d2a9f0"
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
@@ -15,6 +30,28 @@ engine = create_async_engine(
     future=True,
 )
 
+# SQLite tuning applied to every new connection: WAL lets readers (including
+# the backup service) proceed while a write is in progress.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16384",  # 16 MiB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+)
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Apply SQLITE_PRAGMAS to a new DBAPI connection."""
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
 # Create session maker
 async_session_maker = async_sessionmaker(
     engine,
@@ -30,8 +67,25 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def init_db() -> None:
-    """Initialize database (create tables)."""
-    from app.models.module import Base
-
+    """Initialize database (create or upgrade the schema)."""
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await migrate(conn)
+
+
+async def migrate(conn: AsyncConnection) -> None:
+    """Apply any pending alembic revisions on conn."""
+    await conn.run_sync(_upgrade)
+
+
+def _upgrade(connection: Connection) -> None:
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    config.attributes["connection"] = connection
+
+    current = MigrationContext.configure(connection).get_current_revision()
+    if current == ScriptDirectory.from_config(config).get_current_head():
+        return
+    if current is None and inspect(connection).has_table("sfp_modules"):
+        # Created by create_all before migrations were tracked
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
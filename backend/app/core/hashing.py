@@ -0,0 +1,51 @@
+"""SHA-256 helpers for EEPROM checksums."""
+
+import ssl
+from functools import lru_cache
+from hashlib import sha256
+from pathlib import Path
+
+# CPU flags that OpenSSL uses for hardware SHA-256 (x86 SHA-NI, ARMv8 SHA2)
+_SHA_CPU_FLAGS = frozenset({"sha_ni", "sha2"})
+
+
+def sha256_hex(data: bytes) -> str:
+    """
+    Compute the hex SHA-256 digest of data in one call.
+
+    Args:
+        data: Bytes to hash (EEPROM image)
+
+    Returns:
+        64-character lowercase hex digest
+    """
+    return sha256(data).hexdigest()
+
+
+@lru_cache
+def sha256_backend() -> dict[str, str | bool]:
+    """
+    Describe the SHA-256 code path hashlib will use.
+
+    hashlib dispatches to OpenSSL, which selects hardware SHA instructions at
+    runtime when the CPU advertises them. Reads /proc/cpuinfo once.
+
+    Returns:
+        Dictionary with the linked OpenSSL version and whether hardware
+        SHA-256 is available
+    """
+    try:
+        cpuinfo = Path("/proc/cpuinfo").read_text()
+    except OSError:
+        cpuinfo = ""
+
+    flags = set()
+    for line in cpuinfo.splitlines():
+        key, _, value = line.partition(":")
+        if key.strip() in ("flags", "Features"):
+            flags.update(value.split())
+
+    return {
+        "openssl_version": ssl.OPENSSL_VERSION,
+        "hardware_sha256": not _SHA_CPU_FLAGS.isdisjoint(flags),
+    }
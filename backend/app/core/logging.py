@@ -1,19 +1,40 @@
 """Structured logging configuration."""
 
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 import structlog
 
+# Background thread that drains queued log records to stdout
+_listener: QueueListener | None = None
+
 
 def setup_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
-    """Configure structured logging with structlog."""
+    """Configure structured logging with structlog.
+
+    Records are handed to a QueueHandler and written to stdout by a
+    QueueListener thread, so emitting a log line never blocks the event
+    loop on terminal or pipe I/O.
+    """
+    global _listener
+
+    # Replace any listener from a previous setup (e.g. tests, reload)
+    stop_logging()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
 
     # Configure standard library logging (convert level to uppercase)
     logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
+        handlers=[QueueHandler(log_queue)],
         level=log_level.upper(),
+        force=True,
     )
 
     # Configure structlog processors
@@ -41,3 +62,24 @@ def setup_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
+
+
+def stop_logging() -> None:
+    """
+    Flush queued log records and stop the background listener thread.
+
+    Afterwards the root logger writes through the listener's handlers
+    directly, so records logged during shutdown are not queued and lost.
+    """
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            if isinstance(handler, QueueHandler) and handler.queue is _listener.queue:
+                root.removeHandler(handler)
+        for handler in _listener.handlers:
+            root.addHandler(handler)
+        _listener = None
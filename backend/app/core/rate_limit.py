@@ -0,0 +1,38 @@
+"""Request rate limiting."""
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from slowapi import Limiter
+from slowapi.errors import RateLimitExceeded
+from slowapi.util import get_remote_address
+
+# Set by the Supervisor on requests that come in through HA ingress
+INGRESS_USER_HEADER = "X-Remote-User-Id"
+
+
+def client_key(request: Request) -> str:
+    """
+    Rate-limit key for the client behind a request.
+
+    Behind HA ingress every request arrives from the Supervisor proxy, so the
+    peer address alone would put all users in one bucket. Ingress requests are
+    keyed by the Home Assistant user instead. Other requests use the client
+    address, which uvicorn already takes from X-Forwarded-For
+    (--forwarded-allow-ips in the add-on's run script).
+    """
+    user_id = request.headers.get(INGRESS_USER_HEADER)
+    if user_id:
+        return f"user:{user_id}"
+    return get_remote_address(request)
+
+
+# Moving-window limits per client; attached to the app in main.py
+limiter = Limiter(key_func=client_key, strategy="moving-window")
+
+
+async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSONResponse:
+    """Return 429 with a string detail, matching other API errors."""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": f"Rate limit exceeded: {exc.detail}. Please try again later."},
+    )
@@ -1,21 +1,113 @@
 """FastAPI application with modern patterns."""
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 import structlog
-from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from slowapi.errors import RateLimitExceeded
 
+from app.api.v1.bluetooth import set_ble_scanner
+from app.api.v1.ha_bluetooth import set_ha_bluetooth_client
+from app.api.v1.health import health_check
 from app.api.v1.router import api_router
 from app.config import get_settings
 from app.core.database import init_db
-from app.core.logging import setup_logging
+from app.core.hashing import sha256_backend
+from app.core.logging import setup_logging, stop_logging
+from app.core.rate_limit import limiter, rate_limit_exceeded_handler
+from app.services.backup_service import DatabaseBackupService
+from app.services.ble_scanner import BLEScannerService
+from app.services.ha_bluetooth import HomeAssistantBluetoothClient
+from app.services.ha_bluetooth.ble_tracer import get_tracer, init_tracer
 
 settings = get_settings()
 
+# Blocking file I/O (submissions, backups, debug log) shares one disk, so a
+# small pool beats the default min(32, cpu_count + 4) workers.
+IO_EXECUTOR_WORKERS = 8
+
+# Browser/ingress cache lifetime for UI assets (index.html always revalidates)
+ASSET_CACHE_CONTROL = "public, max-age=86400"
+
+logger = structlog.get_logger()
+
+
+async def _start_ha_bluetooth_client() -> HomeAssistantBluetoothClient:
+    """Start the Home Assistant Bluetooth client (HA add-on mode)."""
+    try:
+        bluetooth_service = HomeAssistantBluetoothClient(
+            ha_api_url=settings.ha_api_url,
+            ha_ws_url=settings.ha_ws_url,
+            supervisor_token=settings.supervisor_token,
+            device_patterns=settings.device_name_patterns,
+        )
+        await bluetooth_service.start()
+        set_ha_bluetooth_client(bluetooth_service)
+        logger.info("ha_bluetooth_client_started", patterns=settings.device_name_patterns)
+        return bluetooth_service
+
+    except Exception as e:
+        logger.error("ha_bluetooth_client_startup_failed", error=str(e), exc_info=True)
+        raise  # Don't start if Bluetooth is essential
+
+
+async def _start_ble_scanner() -> BLEScannerService:
+    """
+    Start the background BLE scanner for direct discovery.
+
+    The scanner is registered even if it cannot start yet (e.g. the adapter
+    is not ready); /bluetooth/discover retries starting it on demand.
+    """
+    ble_scanner = BLEScannerService()
+    set_ble_scanner(ble_scanner)
+    try:
+        await ble_scanner.start()
+    except Exception as e:
+        logger.error("ble_scanner_startup_failed", error=str(e), exc_info=True)
+    return ble_scanner
+
+
+async def _start_backup_service() -> DatabaseBackupService | None:
+    """Start the database backup service."""
+    try:
+        backup_service = DatabaseBackupService(max_backups=settings.database_backup_max_count)
+        await backup_service.start()
+        return backup_service
+    except Exception as e:
+        logger.error("backup_service_startup_failed", error=str(e), exc_info=True)
+        return None
+
+
+async def _stop_service(service, name: str) -> None:
+    """Stop a service, logging instead of raising on failure."""
+    try:
+        await service.stop()
+        logger.info(f"{name}_stopped")
+    except Exception as e:
+        logger.error(f"{name}_shutdown_failed", error=str(e))
+
+
+def _started(task: asyncio.Task):
+    """Return the service a finished start task produced, or None."""
+    if task.done() and not task.cancelled() and task.exception() is None:
+        return task.result()
+    return None
+
+
+async def _stop_services(*services: tuple[object | None, str]) -> None:
+    """Stop the given (service, name) pairs concurrently, skipping None."""
+    async with asyncio.TaskGroup() as tg:
+        for service, name in services:
+            if service:
+                tg.create_task(_stop_service(service, name))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -26,86 +118,91 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     setup_logging(settings.log_level, settings.log_json)
-    logger = structlog.get_logger()
     logger.info(
         "application_startup",
         version=settings.version,
     )
 
+    # Dedicated executor for asyncio.to_thread / run_in_executor(None, ...)
+    io_executor = ThreadPoolExecutor(
+        max_workers=IO_EXECUTOR_WORKERS, thread_name_prefix="sfplib-io"
+    )
+    asyncio.get_running_loop().set_default_executor(io_executor)
+
+    # EEPROM checksums go through hashlib, which dispatches to OpenSSL. OpenSSL
+    # selects SHA-NI/ARMv8 SHA2 code paths at runtime, so log which one applies.
+    logger.info("hashlib_backend", **sha256_backend())
+
     # Initialize BLE tracer if enabled
     if settings.ble_trace_logging:
-        from app.services.ha_bluetooth.ble_tracer import init_tracer
         init_tracer(enabled=True)
         logger.info("ble_tracer_enabled")
 
     await init_db()
     logger.info("database_initialized")
 
-    # Initialize Bluetooth service (HA add-on only)
-    bluetooth_service = None
-    backup_service = None
+    # Community submission inbox; requests only create per-submission dirs
+    os.makedirs(settings.submissions_dir, exist_ok=True)
 
-    # Home Assistant Add-On mode: Use HA Bluetooth API
+    # Start services concurrently; each one logs its own failure. A failed
+    # HA client start aborts startup (Bluetooth is essential).
     try:
-        from app.api.v1.ha_bluetooth import set_ha_bluetooth_client
-        from app.services.ha_bluetooth import HomeAssistantBluetoothClient
-
-        bluetooth_service = HomeAssistantBluetoothClient(
-            ha_api_url=settings.ha_api_url,
-            ha_ws_url=settings.ha_ws_url,
-            supervisor_token=settings.supervisor_token,
-            device_patterns=settings.device_name_patterns,
+        async with asyncio.TaskGroup() as tg:
+            bluetooth_task = tg.create_task(_start_ha_bluetooth_client())
+            ble_scanner_task = tg.create_task(_start_ble_scanner())
+            backup_task = tg.create_task(_start_backup_service())
+    except BaseException as e:
+        # Services that finished starting before the failure would otherwise
+        # keep running after the app has given up
+        await _stop_services(
+            (_started(backup_task), "backup_service"),
+            (_started(ble_scanner_task), "ble_scanner"),
+            (_started(bluetooth_task), "bluetooth_service"),
         )
-        await bluetooth_service.start()
-        set_ha_bluetooth_client(bluetooth_service)
-        logger.info("ha_bluetooth_client_started", patterns=settings.device_name_patterns)
+        io_executor.shutdown(wait=True)
+        stop_logging()
+        if isinstance(e, BaseExceptionGroup) and len(e.exceptions) == 1:
+            # Surface the failing service's own error, not the TaskGroup wrapper
+            raise e.exceptions[0] from None
+        raise
 
-    except Exception as e:
-        logger.error("ha_bluetooth_client_startup_failed", error=str(e), exc_info=True)
-        raise  # Don't start if Bluetooth is essential
-
-    # Start database backup service
-    try:
-        from app.services.backup_service import DatabaseBackupService
-        backup_service = DatabaseBackupService(max_backups=settings.database_backup_max_count)
-        await backup_service.start()
-    except Exception as e:
-        logger.error("backup_service_startup_failed", error=str(e), exc_info=True)
+    bluetooth_service = bluetooth_task.result()
+    ble_scanner = ble_scanner_task.result()
+    backup_service = backup_task.result()
 
     yield
 
     # Shutdown
-    if backup_service:
-        try:
-            await backup_service.stop()
-            logger.info("backup_service_stopped")
-        except Exception as e:
-            logger.error("backup_service_shutdown_failed", error=str(e))
-
-    if bluetooth_service:
-        try:
-            await bluetooth_service.stop()
-            logger.info("bluetooth_service_stopped")
-        except Exception as e:
-            logger.error("bluetooth_service_shutdown_failed", error=str(e))
+    await _stop_services(
+        (backup_service, "backup_service"),
+        (ble_scanner, "ble_scanner"),
+        (bluetooth_service, "bluetooth_service"),
+    )
 
     # Close BLE tracer if enabled
     if settings.ble_trace_logging:
-        from app.services.ha_bluetooth.ble_tracer import get_tracer
         get_tracer().close()
 
+    io_executor.shutdown(wait=True)
+
     logger.info("application_shutdown")
+    stop_logging()
 
 
 app = FastAPI(
     title=settings.project_name,
     version=settings.version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     openapi_url=f"{settings.api_v1_prefix}/openapi.json",
     docs_url=f"{settings.api_v1_prefix}/docs",
     redoc_url=f"{settings.api_v1_prefix}/redoc",
 )
 
+# Rate limiting (limits are declared per endpoint)
+app.state.limiter = limiter
+app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -118,11 +215,8 @@ app.add_middleware(
 # Include API v1 router
 app.include_router(api_router, prefix=settings.api_v1_prefix)
 
-# Health check endpoint
-@app.get("/health")
-async def health_check():
-    """Root health check."""
-    return {"status": "healthy", "version": settings.version}
+# Health check endpoint (same pre-serialized response as /api/v1/health)
+app.add_api_route("/health", health_check, methods=["GET"])
 
 
 # Backward compatibility: Keep legacy /api routes
@@ -135,39 +229,35 @@ async def legacy_get_modules():
 
 
 # Serve static UI files for Home Assistant add-on ingress
-from fastapi.responses import FileResponse
-
 static_ui_path = Path("/usr/share/sfplib/ui")
 
-@app.get("/app.js")
-async def serve_app_js():
-    """Serve app.js."""
-    if not static_ui_path.exists():
-        from fastapi import HTTPException
-        raise HTTPException(status_code=404, detail="UI not available")
-    return FileResponse(static_ui_path / "app.js", media_type="application/javascript")
-
-@app.get("/logo.svg")
-async def serve_logo():
-    """Serve logo.svg."""
-    if not static_ui_path.exists():
-        from fastapi import HTTPException
-        raise HTTPException(status_code=404, detail="UI not available")
-    return FileResponse(static_ui_path / "logo.svg", media_type="image/svg+xml")
-
-@app.get("/")
-async def serve_ui():
-    """Serve the UI index.html at root path."""
-    if not static_ui_path.exists():
+
+class UIStaticFiles(StaticFiles):
+    """StaticFiles with Cache-Control headers for the add-on UI."""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200) -> Response:
+        """Add Cache-Control to StaticFiles' ETag/Last-Modified handling."""
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if str(full_path).endswith(".html"):
+            # Always revalidate the entry page so add-on updates are picked up
+            response.headers["Cache-Control"] = "no-cache"
+        else:
+            response.headers["Cache-Control"] = ASSET_CACHE_CONTROL
+        return response
+
+
+if static_ui_path.exists():
+    # Mounted last so it only sees paths no API route matched
+    app.mount("/", UIStaticFiles(directory=static_ui_path, html=True), name="ui")
+    logger.info("static_ui_available", path=str(static_ui_path))
+else:
+    @app.get("/")
+    async def serve_ui_unavailable():
+        """API information when the UI is not installed."""
         return {
             "name": settings.project_name,
             "version": settings.version,
             "docs_url": f"{settings.api_v1_prefix}/docs",
         }
-    return FileResponse(static_ui_path / "index.html")
 
-logger = structlog.get_logger()
-if static_ui_path.exists():
-    logger.info("static_ui_available", path=str(static_ui_path))
-else:
     logger.warning("static_ui_not_found", path=str(static_ui_path))
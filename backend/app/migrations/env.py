@@ -0,0 +1,43 @@
+"""Alembic environment for the SFP module database."""
+
+import asyncio
+
+from alembic import context
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import get_settings
+from app.models.module import Base
+
+target_metadata = Base.metadata
+
+
+def run_migrations(connection: Connection) -> None:
+    """Run the pending revisions on connection."""
+    # SQLite cannot ALTER most constraints; batch mode rebuilds the table
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    """Run migrations against the configured database (alembic CLI)."""
+    engine = create_async_engine(get_settings().database_url)
+    async with engine.connect() as connection:
+        await connection.run_sync(run_migrations)
+    await engine.dispose()
+
+
+if context.is_offline_mode():
+    raise RuntimeError("Offline (--sql) migrations are not supported")
+
+# init_db() passes its own connection; the alembic CLI does not
+connection = context.config.attributes.get("connection")
+if connection is not None:
+    run_migrations(connection)
+else:
+    asyncio.run(run_migrations_online())
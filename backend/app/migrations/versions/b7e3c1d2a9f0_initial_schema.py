@@ -0,0 +1,45 @@
+"""Initial schema
+
+The sfp_modules table as Base.metadata.create_all built it before
+migrations were tracked. init_db() stamps such databases with this
+revision instead of running it.
+
+Revision ID: b7e3c1d2a9f0
+Revises:
+Create Date: 2026-10-15 21:40:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "b7e3c1d2a9f0"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create sfp_modules and its indexes."""
+    op.create_table(
+        "sfp_modules",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("vendor", sa.String(length=100), nullable=True),
+        sa.Column("model", sa.String(length=100), nullable=True),
+        sa.Column("serial", sa.String(length=100), nullable=True),
+        sa.Column("eeprom_data", sa.LargeBinary(), nullable=False),
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_vendor_model", "sfp_modules", ["vendor", "model"])
+    op.create_index("ix_sfp_modules_sha256", "sfp_modules", ["sha256"], unique=True)
+
+
+def downgrade() -> None:
+    """Drop sfp_modules."""
+    op.drop_index("ix_sfp_modules_sha256", table_name="sfp_modules")
+    op.drop_index("idx_vendor_model", table_name="sfp_modules")
+    op.drop_table("sfp_modules")
@@ -0,0 +1,54 @@
+"""Require 256-byte EEPROM images
+
+Adds the eeprom_256_bytes CHECK constraint to sfp_modules. Rows with a
+wrong-size image could never be written to a module; they are moved to
+sfp_modules_invalid_eeprom instead of being dropped.
+
+Revision ID: d4a8f6e2c5b1
+Revises: b7e3c1d2a9f0
+Create Date: 2026-10-15 21:45:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import structlog
+from alembic import op
+
+revision: str = "d4a8f6e2c5b1"
+down_revision: str | None = "b7e3c1d2a9f0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+logger = structlog.get_logger()
+
+EEPROM_SIZE = 256
+
+
+def upgrade() -> None:
+    """Set aside wrong-size rows, then add the constraint."""
+    invalid = op.get_bind().execute(
+        sa.text(f"SELECT count(*) FROM sfp_modules WHERE length(eeprom_data) != {EEPROM_SIZE}")
+    ).scalar()
+    if invalid:
+        op.execute(
+            "CREATE TABLE IF NOT EXISTS sfp_modules_invalid_eeprom AS "
+            "SELECT * FROM sfp_modules WHERE 0"
+        )
+        op.execute(
+            "INSERT INTO sfp_modules_invalid_eeprom SELECT * FROM sfp_modules "
+            f"WHERE length(eeprom_data) != {EEPROM_SIZE}"
+        )
+        op.execute(f"DELETE FROM sfp_modules WHERE length(eeprom_data) != {EEPROM_SIZE}")
+        logger.warning("invalid_eeprom_rows_moved", count=invalid)
+
+    with op.batch_alter_table("sfp_modules") as batch_op:
+        batch_op.create_check_constraint(
+            "eeprom_256_bytes", f"length(eeprom_data) = {EEPROM_SIZE}"
+        )
+
+
+def downgrade() -> None:
+    """Drop the constraint (rows moved aside are not restored)."""
+    with op.batch_alter_table("sfp_modules") as batch_op:
+        batch_op.drop_constraint("eeprom_256_bytes", type_="check")
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import Index, LargeBinary, String
+from sqlalchemy import CheckConstraint, Index, LargeBinary, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -12,6 +12,10 @@ class Base(DeclarativeBase):
     pass
 
 
+# Size of the A0h EEPROM page read from / written to the SFP Wizard
+EEPROM_SIZE = 256
+
+
 class SFPModule(Base):
     """SFP module EEPROM data model."""
 
@@ -26,7 +30,10 @@ class SFPModule(Base):
     sha256: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
 
-    __table_args__ = (Index("idx_vendor_model", "vendor", "model"),)
+    __table_args__ = (
+        Index("idx_vendor_model", "vendor", "model"),
+        CheckConstraint(f"length(eeprom_data) = {EEPROM_SIZE}", name="eeprom_256_bytes"),
+    )
 
     def __repr__(self) -> str:
         """String representation."""
@@ -2,10 +2,19 @@
 
 from collections.abc import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.module import SFPModule
+from app.models.module import EEPROM_SIZE, SFPModule
+
+
+def _check_eeprom_size(eeprom_data: bytes) -> None:
+    """Reject EEPROM images the eeprom_256_bytes constraint would refuse."""
+    if len(eeprom_data) != EEPROM_SIZE:
+        raise ValueError(
+            f"EEPROM data must be {EEPROM_SIZE} bytes, got {len(eeprom_data)}"
+        )
 
 
 class ModuleRepository:
@@ -24,6 +33,27 @@ class ModuleRepository:
         """Get module by ID."""
         return await self.session.get(SFPModule, module_id)
 
+    async def get_write_payload(self, module_id: int) -> Row | None:
+        """
+        Get only the columns needed to write a module to hardware.
+
+        Args:
+            module_id: Module ID
+
+        Returns:
+            Row with id, name, vendor, model, serial and eeprom_data, or None
+        """
+        stmt = select(
+            SFPModule.id,
+            SFPModule.name,
+            SFPModule.vendor,
+            SFPModule.model,
+            SFPModule.serial,
+            SFPModule.eeprom_data,
+        ).where(SFPModule.id == module_id)
+        result = await self.session.execute(stmt)
+        return result.first()
+
     async def get_by_sha256(self, sha256: str) -> SFPModule | None:
         """Get module by SHA-256 checksum."""
         result = await self.session.execute(
@@ -32,12 +62,66 @@ class ModuleRepository:
         return result.scalar_one_or_none()
 
     async def create(self, module: SFPModule) -> SFPModule:
-        """Create a new module."""
+        """
+        Create a new module.
+
+        Raises:
+            ValueError: If the EEPROM data is not exactly EEPROM_SIZE bytes
+        """
+        _check_eeprom_size(module.eeprom_data)
         self.session.add(module)
         await self.session.flush()
         await self.session.refresh(module)
         return module
 
+    async def create_if_absent(
+        self,
+        *,
+        name: str,
+        vendor: str | None,
+        model: str | None,
+        serial: str | None,
+        eeprom_data: bytes,
+        sha256: str,
+    ) -> tuple[SFPModule, bool]:
+        """
+        Create a module unless one with the same SHA-256 checksum exists.
+
+        Duplicate detection and insert happen in a single
+        INSERT ... ON CONFLICT (sha256) DO NOTHING RETURNING statement, so
+        there is no window between the check and the insert.
+
+        Returns:
+            Tuple of (module, created). On conflict the existing module is
+            returned with created=False.
+
+        Raises:
+            ValueError: If the EEPROM data is not exactly EEPROM_SIZE bytes
+        """
+        _check_eeprom_size(eeprom_data)
+        stmt = (
+            sqlite_insert(SFPModule)
+            .values(
+                name=name,
+                vendor=vendor,
+                model=model,
+                serial=serial,
+                eeprom_data=eeprom_data,
+                sha256=sha256,
+            )
+            .on_conflict_do_nothing(index_elements=["sha256"])
+            .returning(SFPModule)
+        )
+        module = (await self.session.scalars(stmt)).one_or_none()
+        if module is not None:
+            return module, True
+
+        existing = await self.get_by_sha256(sha256)
+        if existing is None:
+            # Conflicting row was deleted between the insert and the lookup
+            raise RuntimeError(f"Module with SHA-256 {sha256[:16]}... vanished during insert")
+        return existing, False
+
     async def delete(self, module_id: int) -> bool:
         """Delete module by ID. Returns True if deleted, False if not found."""
         module = await self.get_by_id(module_id)
@@ -1,8 +1,10 @@
 """Database backup service for Home Assistant Add-on."""
 
 import asyncio
-import shutil
+import os
+import sqlite3
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -12,6 +14,22 @@ from app.config import get_settings
 
 logger = structlog.get_logger()
 
+BACKUP_PREFIX = "sfp_library_backup_"
+BACKUP_SUFFIX = ".db"
+
+
+def _sqlite_copy(source: Path, target: Path) -> None:
+    """Copy one SQLite database into another with the online backup API."""
+    src = sqlite3.connect(source)
+    try:
+        dst = sqlite3.connect(target)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
 
 class DatabaseBackupService:
     """
@@ -141,12 +159,12 @@ class DatabaseBackupService:
 
         # Generate backup filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_filename = f"sfp_library_backup_{timestamp}.db"
+        backup_filename = f"{BACKUP_PREFIX}{timestamp}{BACKUP_SUFFIX}"
         backup_path = self.backup_dir / backup_filename
 
         try:
-            # Copy database file
-            await asyncio.to_thread(shutil.copy2, self.db_file, backup_path)
+            # Page-level copy through SQLite's online backup API
+            await asyncio.to_thread(self._sqlite_backup, backup_path)
 
             file_size = backup_path.stat().st_size
             logger.info(
@@ -169,21 +187,43 @@ class DatabaseBackupService:
             )
             return None
 
+    def _sqlite_backup(self, backup_path: Path) -> None:
+        """
+        Copy the live database with SQLite's online backup API (runs in thread pool).
+
+        Unlike a raw file copy this reads a consistent snapshot under
+        SQLite's locking, including committed WAL content.
+
+        Args:
+            backup_path: Destination database file
+        """
+        _sqlite_copy(self.db_file, backup_path)
+
+    def _scan_backups(self) -> list[os.DirEntry]:
+        """
+        List backup files in the backup directory, newest first.
+
+        Filenames contain timestamps so lexicographic sorting works correctly.
+        DirEntry.stat() reuses the directory scan where the OS allows it.
+        """
+        with os.scandir(self.backup_dir) as it:
+            entries = [
+                entry
+                for entry in it
+                if entry.name.startswith(BACKUP_PREFIX) and entry.name.endswith(BACKUP_SUFFIX)
+            ]
+        entries.sort(key=attrgetter("name"), reverse=True)
+        return entries
+
     async def _cleanup_old_backups(self) -> None:
         """Remove old backup files, keeping only max_backups most recent."""
         try:
-            # Get all backup files sorted by filename (newest first)
-            # Filenames contain timestamps so lexicographic sorting works correctly
-            backup_files = sorted(
-                self.backup_dir.glob("sfp_library_backup_*.db"),
-                key=lambda p: p.name,
-                reverse=True,
-            )
+            backup_files = self._scan_backups()
 
             # Remove excess backups
             files_to_remove = backup_files[self.max_backups:]
             for backup_file in files_to_remove:
-                backup_file.unlink()
+                os.unlink(backup_file.path)
                 logger.info("database_backup_removed", file=backup_file.name)
 
             if files_to_remove:
@@ -204,13 +244,7 @@ class DatabaseBackupService:
             List of dicts with backup file info (name, size, timestamp)
         """
         try:
-            # Sort by filename (newest first)
-            # Filenames contain timestamps so lexicographic sorting works correctly
-            backup_files = sorted(
-                self.backup_dir.glob("sfp_library_backup_*.db"),
-                key=lambda p: p.name,
-                reverse=True,
-            )
+            backup_files = self._scan_backups()
 
             backups = []
             for backup_file in backup_files:
@@ -249,16 +283,16 @@ class DatabaseBackupService:
             if self.db_file.exists():
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 pre_restore_backup = self.backup_dir / (
-                    f"sfp_library_backup_pre_restore_{timestamp}.db"
+                    f"{BACKUP_PREFIX}pre_restore_{timestamp}{BACKUP_SUFFIX}"
                 )
-                await asyncio.to_thread(shutil.copy2, self.db_file, pre_restore_backup)
+                await asyncio.to_thread(self._sqlite_backup, pre_restore_backup)
                 logger.info("database_pre_restore_backup_created", file=pre_restore_backup.name)
             else:
                 pre_restore_backup = None
                 logger.info("database_pre_restore_backup_skipped", reason="database_does_not_exist")
 
-            # Restore from backup
-            await asyncio.to_thread(shutil.copy2, backup_path, self.db_file)
+            # Restore from backup through SQLite so the live WAL stays consistent
+            await asyncio.to_thread(_sqlite_copy, backup_path, self.db_file)
 
             logger.info(
                 "database_backup_restored",
@@ -10,16 +10,44 @@ Based on discovered protocol:
 Protocol: HTTP-like commands over BLE notifications
 - Commands sent to write characteristic
 - Responses received via notify characteristic
-- Binary data chunked in 20-byte packets
+- Binary data chunked to the negotiated MTU (20-byte packets at the default MTU)
 """
 
 import asyncio
+import re
+import zlib
 import structlog
+from collections.abc import Callable
 from typing import Optional
 from bleak import BleakClient
 
 logger = structlog.get_logger(__name__)
 
+# Any non-zero byte in an XOR of two buffers marks a difference
+_NONZERO_BYTE = re.compile(rb"[^\x00]")
+
+
+def _diff_offsets(expected: bytes, actual: bytes) -> list[int]:
+    """
+    Return the offsets at which two equal-length buffers differ.
+
+    The buffers are XORed as big integers and the non-zero bytes located with
+    a regex scan, so no per-byte Python loop runs regardless of EEPROM size.
+    """
+    xored = (int.from_bytes(expected) ^ int.from_bytes(actual)).to_bytes(len(expected))
+    return [m.start() for m in _NONZERO_BYTE.finditer(xored)]
+
+
+class EEPROMVerificationError(RuntimeError):
+    """Raised when EEPROM read-back does not match the data that was written."""
+
+    def __init__(self, diff_offsets: list[int]):
+        self.diff_offsets = diff_offsets
+        super().__init__(
+            f"Verification failed: {len(diff_offsets)} bytes differ "
+            f"(offsets: {diff_offsets}). Module may be corrupted!"
+        )
+
 
 class BLEOperationsService:
     """Service for BLE operations with SFP Wizard."""
@@ -29,17 +57,63 @@ class BLEOperationsService:
     WRITE_CHAR_UUID = "9280F26C-A56F-43EA-B769-D5D732E1AC67"
     NOTIFY_CHAR_UUID = "DC272A22-43F2-416B-8FA5-63A071542FAC"
 
-    def __init__(self, device_address: str):
+    # ATT payload for the default 23-byte MTU (MTU minus 3-byte ATT header)
+    DEFAULT_CHUNK_SIZE = 20
+
+    # With write-without-response, every Nth chunk (and the last) is sent with
+    # response so the host stack's TX buffer cannot overflow
+    WRITE_BARRIER_INTERVAL = 4
+
+    # Upper bound on a buffered response; EEPROM images are 256 bytes and
+    # command replies are shorter, so anything larger is a misbehaving device
+    MAX_RESPONSE_SIZE = 4096
+
+    # Command payloads, encoded once
+    CMD_READ_START = b"POST /sif/start"
+    CMD_WRITE = b"POST /sif/write"
+    CMD_ERASE = b"POST /sif/erase"
+    CMD_STATS = b"GET /stats"
+    CMD_VERSION = b"GET /api/1.0/version"
+
+    def __init__(self, device_address: str, inter_chunk_delay: float = 0.0):
         """
         Initialize BLE operations service.
 
         Args:
             device_address: MAC address of SFP Wizard device
+            inter_chunk_delay: Optional pause in seconds between EEPROM write
+                chunks, for firmware that drops data when chunks arrive
+                back-to-back. Flow control otherwise comes from the ACKed
+                barrier writes.
         """
         self.device_address = device_address
+        self.inter_chunk_delay = inter_chunk_delay
+        # Bound once so every event carries the device without re-binding
+        self._log = logger.bind(device=device_address)
         self._client: Optional[BleakClient] = None
-        self._notification_queue: asyncio.Queue = asyncio.Queue()
-        self._response_buffer = bytearray()
+        # Notification payloads are collected here as they arrive (bleak
+        # hands each callback a fresh bytearray) and joined once at the end.
+        # _data_event is set once _response_len reaches _wake_len, so a
+        # multi-notification response wakes the reader once rather than per
+        # packet. All of these are reset when a command is sent.
+        self._response_parts: list[bytearray] = []
+        self._response_len = 0
+        self._data_event = asyncio.Event()
+        self._wake_len = 1
+        # While a read is compared against known data, whether a notification
+        # has already differed from it (which ends the read early)
+        self._expected: Optional[bytes] = None
+        self._mismatch = False
+        # Notifications outside a command/response exchange are dropped
+        self._awaiting_response = False
+        self._on_chunk: Optional[Callable[[bytes], None]] = None
+        # Max bytes per GATT write, updated from the negotiated MTU on connect
+        self._mtu_payload = self.DEFAULT_CHUNK_SIZE
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the underlying BLE connection is up."""
+        return self._client is not None and self._client.is_connected
 
     async def connect(self, timeout: float = 30.0) -> None:
         """
@@ -52,10 +126,13 @@ class BLEOperationsService:
             TimeoutError: If connection times out
             ConnectionError: If connection fails
         """
-        logger.info("ble_connecting", device=self.device_address)
+        self._log.info("ble_connecting")
 
         try:
-            self._client = BleakClient(self.device_address, timeout=timeout)
+            # Only the SIF service is used, so skip discovering the others
+            self._client = BleakClient(
+                self.device_address, timeout=timeout, services=[self.SERVICE_UUID]
+            )
             await self._client.connect()
 
             # Start notification handler
@@ -63,7 +140,9 @@ class BLEOperationsService:
                 self.NOTIFY_CHAR_UUID, self._notification_callback
             )
 
-            logger.info("ble_connected", device=self.device_address)
+            self._negotiate_mtu()
+
+            self._log.info("ble_connected", mtu_payload=self._mtu_payload)
 
         except asyncio.TimeoutError:
             raise TimeoutError(
@@ -72,15 +151,43 @@ class BLEOperationsService:
         except Exception as e:
             raise ConnectionError(f"Failed to connect to {self.device_address}: {e}")
 
+    def _negotiate_mtu(self) -> None:
+        """
+        Size GATT writes from the negotiated MTU instead of the 23-byte default.
+
+        Only public bleak API is used (bleak ^1.1, see pyproject.toml): the
+        write characteristic's max_write_without_response_size, which BlueZ
+        >= 5.62 derives from the real MTU. BleakClient.mtu_size is only a
+        fallback when the characteristic is missing; on BlueZ it reports the
+        23-byte default unless the MTU was acquired.
+        """
+        char = self._client.services.get_characteristic(self.WRITE_CHAR_UUID)
+        if char is not None:
+            size = char.max_write_without_response_size
+        else:
+            size = self._client.mtu_size - 3
+
+        self._mtu_payload = max(self.DEFAULT_CHUNK_SIZE, size)
+
     async def disconnect(self) -> None:
         """Disconnect from device and cleanup."""
-        if self._client and self._client.is_connected:
+        if self.is_connected:
+            # One after the other: a stop_notify still in flight when the
+            # client disconnects fails spuriously. A failed stop_notify must
+            # not prevent the disconnect, so errors are reported afterwards.
+            errors = []
             try:
                 await self._client.stop_notify(self.NOTIFY_CHAR_UUID)
+            except Exception as e:
+                errors.append(str(e))
+            try:
                 await self._client.disconnect()
-                logger.info("ble_disconnected", device=self.device_address)
             except Exception as e:
-                logger.error("ble_disconnect_error", device=self.device_address, error=str(e))
+                errors.append(str(e))
+            if errors:
+                self._log.error("ble_disconnect_error", error=errors)
+            else:
+                self._log.info("ble_disconnected")
         self._client = None
 
     def _notification_callback(self, sender: int, data: bytearray) -> None:
@@ -91,115 +198,194 @@ class BLEOperationsService:
             sender: Characteristic handle
             data: Notification payload
         """
-        self._notification_queue.put_nowait(bytes(data))
-
-    async def _send_command(self, command: str) -> None:
+        if not self._awaiting_response:
+            self._log.debug("ble_unsolicited_notification", bytes=len(data))
+            return
+        if self._response_len + len(data) > self.MAX_RESPONSE_SIZE:
+            self._log.warning(
+                "ble_response_overflow",
+                buffered=self._response_len,
+                limit=self.MAX_RESPONSE_SIZE,
+            )
+            self._response_parts = []
+            self._response_len = 0
+            return
+
+        offset = self._response_len
+        self._response_parts.append(data)
+        self._response_len += len(data)
+        if self._on_chunk is not None:
+            self._on_chunk(data)
+        if self._response_len >= self._wake_len:
+            self._data_event.set()
+        elif (
+            self._expected is not None
+            and data != self._expected[offset : self._response_len]
+        ):
+            self._mismatch = True
+            self._data_event.set()
+
+    async def _send_command(self, payload: bytes, response: bool = True) -> None:
         """
         Send HTTP-like command to device.
 
         Args:
-            command: Command string (e.g., "GET /stats")
+            payload: Encoded command (one of the CMD_* constants)
+            response: If False, send as write-without-response so the call
+                returns once the command is queued rather than ACKed
 
         Raises:
             ConnectionError: If not connected
         """
-        if not self._client or not self._client.is_connected:
+        if not self.is_connected:
             raise ConnectionError("Not connected to device")
 
-        logger.debug("ble_sending_command", command=command)
+        # Start a fresh response; anything received earlier is stale
+        self._response_parts = []
+        self._response_len = 0
+        self._data_event.clear()
+        self._wake_len = 1
+        self._awaiting_response = True
+
+        self._log.debug("ble_sending_command", command=payload)
         await self._client.write_gatt_char(
-            self.WRITE_CHAR_UUID, command.encode("utf-8")
+            self.WRITE_CHAR_UUID, payload, response=response
         )
 
-    async def _read_response(self, timeout: float = 10.0) -> bytes:
+    async def _read_response(
+        self,
+        timeout: float = 10.0,
+        on_chunk: Optional[Callable[[bytes], None]] = None,
+        expected_len: Optional[int] = None,
+        expected: Optional[bytes] = None,
+    ) -> bytes:
         """
-        Read response from notification queue.
+        Wait for the response to the last command.
 
         Args:
             timeout: Response timeout in seconds
+            on_chunk: Optional callback invoked with each notification payload
+                as it arrives (e.g. a hasher's ``update``)
+            expected_len: If set, keep collecting notifications until at least
+                this many bytes arrived; otherwise return after the first one
+            expected: Data the response should match. With expected_len, the
+                wait ends early at the first notification that differs, and
+                the partial response is returned.
 
         Returns:
-            Complete response data
+            Complete response data (truncated on an expected mismatch)
 
         Raises:
-            TimeoutError: If no response within timeout
+            TimeoutError: If no (or, with expected_len, incomplete) response
+                within timeout
         """
-        self._response_buffer.clear()
-        end_time = asyncio.get_event_loop().time() + timeout
-
-        while True:
-            remaining = end_time - asyncio.get_event_loop().time()
-            if remaining <= 0:
-                while True:
-                    try:
-                        self._notification_queue.get_nowait()
-                    except asyncio.QueueEmpty:
-                        break
-                raise TimeoutError(f"Response timeout after {timeout}s")
+        # Data may already have arrived between sending the command and now
+        if on_chunk is not None:
+            for part in self._response_parts:
+                on_chunk(part)
+        self._on_chunk = on_chunk
+        self._mismatch = expected is not None and not expected.startswith(
+            b"".join(self._response_parts)
+        )
+        self._expected = expected
 
-            try:
-                data = await asyncio.wait_for(
-                    self._notification_queue.get(), timeout=remaining
-                )
-                self._response_buffer.extend(data)
-
-                # Check for response terminator (implementation specific)
-                # For now, assume single notification contains full response
-                # TODO: Implement proper response parsing based on protocol
-                return bytes(self._response_buffer)
-
-            except asyncio.TimeoutError:
-                if self._response_buffer:
-                    # Got partial data, return it
-                    return bytes(self._response_buffer)
-                # Clear queue to prevent memory leaks
-                while True:
-                    try:
-                        self._notification_queue.get_nowait()
-                    except asyncio.QueueEmpty:
-                        break
-
-    async def read_eeprom(self) -> bytes:
+        # Without expected_len any data at all completes the response. If
+        # enough has already arrived, return without awaiting the event.
+        needed = expected_len or 1
+        self._wake_len = needed
+        try:
+            # One deadline for the whole response, however many notifications
+            async with asyncio.timeout(timeout):
+                while self._response_len < needed and not self._mismatch:
+                    await self._data_event.wait()
+                    self._data_event.clear()
+        except TimeoutError:
+            if expected_len is not None and self._response_len:
+                raise TimeoutError(
+                    f"Incomplete response after {timeout}s: got "
+                    f"{self._response_len} of {expected_len} bytes"
+                ) from None
+            raise TimeoutError(f"Response timeout after {timeout}s") from None
+        finally:
+            self._on_chunk = None
+            self._expected = None
+            self._awaiting_response = False
+
+        # Without expected_len the response is assumed to fit in a single
+        # notification (command replies are short)
+        # TODO: Implement proper response parsing based on protocol
+        # bytes.join sizes the result once and copies each part a single time
+        response = b"".join(self._response_parts)
+        self._response_parts = []
+        self._response_len = 0
+        return response
+
+    async def read_eeprom(
+        self,
+        on_chunk: Optional[Callable[[bytes], None]] = None,
+        expected: Optional[bytes] = None,
+    ) -> bytes:
         """
         Read SFP module EEPROM data.
 
+        Args:
+            on_chunk: Optional callback fed each chunk as it arrives over BLE,
+                so callers can hash or inspect data while the read is in flight
+            expected: Optional image the EEPROM should contain (write
+                verification). The read stops at the first chunk that differs
+                and returns the data received so far.
+
         Returns:
-            Raw EEPROM data (256 bytes)
+            Raw EEPROM data (256 bytes, or fewer if it diverged from expected)
 
         Raises:
             ConnectionError: If not connected
             TimeoutError: If operation times out
             RuntimeError: If read fails
         """
-        logger.info("ble_reading_eeprom")
+        self._log.info("ble_reading_eeprom")
 
         try:
             # Send start command
-            await self._send_command("POST /sif/start")
+            await self._send_command(self.CMD_READ_START)
 
-            # Read response data
-            # TODO: Implement proper chunked reading based on protocol exploration
-            data = await self._read_response(timeout=30.0)
+            # Collect notifications until the full 256-byte image has arrived
+            data = await self._read_response(
+                timeout=30.0, on_chunk=on_chunk, expected_len=256, expected=expected
+            )
 
-            if len(data) != 256:
+            if len(data) != 256 and (expected is None or expected.startswith(data)):
                 raise RuntimeError(
                     f"Incorrect EEPROM data length: got {len(data)} bytes, expected 256"
                 )
 
-            logger.info("ble_read_success", bytes=len(data))
+            self._log.info("ble_read_success", bytes=len(data))
             return data
 
         except Exception as e:
-            logger.error("ble_read_failed", error=str(e))
+            self._log.error("ble_read_failed", error=str(e))
             raise
 
-    async def write_eeprom(self, data: bytes, verify: bool = True) -> bool:
+    async def write_eeprom(
+        self,
+        data: bytes,
+        verify: bool = True,
+        ack_command: bool = False,
+        ack_every_chunk: bool = False,
+    ) -> bool:
         """
         Write SFP module EEPROM data.
 
         Args:
             data: EEPROM data to write (256 bytes)
             verify: If True, read back and verify after write
+            ack_command: If True, send the write command as write-with-response
+                and wait for its ACK before sending data. By default it is
+                queued without one.
+            ack_every_chunk: If True, send every data chunk as
+                write-with-response (for firmware that needs an ACK per
+                chunk). By default chunks use write-without-response with
+                periodic ACKed barrier writes.
 
         Returns:
             True if write successful (and verified if requested)
@@ -213,47 +399,87 @@ class BLEOperationsService:
         if len(data) != 256:
             raise ValueError(f"EEPROM data must be 256 bytes, got {len(data)}")
 
-        logger.info("ble_writing_eeprom", verify=verify)
+        # The firmware has no checksum command yet, so verification still
+        # needs a full read-back. Log the CRC-32 so a device-side CRC can be
+        # compared against it once the protocol exposes one.
+        crc32 = zlib.crc32(data)
+        self._log.info("ble_writing_eeprom", verify=verify, crc32=f"{crc32:08x}")
 
         try:
-            # Send write command
-            await self._send_command("POST /sif/write")
-
-            # TODO: Implement chunked writing (20-byte packets)
-            # Based on BLE MTU, data must be sent in small chunks
-            # FIXME: The sleep delay is currently fixed at 50ms but may need to be
-            # configurable or adaptive based on device response. Ideally, implement
-            # an acknowledgment mechanism if the device supports it.
-
-            chunk_size = 20
-            for i in range(0, len(data), chunk_size):
+            # Queue the write command without waiting a connection interval
+            # for its ACK; the first data chunks follow it in the same
+            # write queue, so they overlap with the device preparing to
+            # receive. The ACKed barrier writes below still bound the stream.
+            await self._send_command(self.CMD_WRITE, response=ack_command)
+
+            # Data is sent in MTU-sized chunks (20 bytes at the default MTU,
+            # up to 244 bytes once a larger MTU has been negotiated). Chunks
+            # go out as write-without-response; every WRITE_BARRIER_INTERVAL-th
+            # chunk and the final one are acknowledged, which paces the stream
+            # without a fixed per-chunk delay.
+            #
+            # Writes are awaited one at a time on purpose: the device appends
+            # chunks in arrival order, and concurrently dispatched
+            # write_gatt_char calls (e.g. via asyncio.gather) are not
+            # guaranteed to reach the controller in submission order.
+            # Without-response writes return as soon as they are queued, so
+            # this loop does not wait on the radio between barriers anyway.
+            chunk_size = self._mtu_payload
+            last = len(data) - chunk_size
+            for n, i in enumerate(range(0, len(data), chunk_size), start=1):
                 chunk = data[i : i + chunk_size]
-                await self._client.write_gatt_char(self.WRITE_CHAR_UUID, chunk)
-                await asyncio.sleep(0.05)  # 50ms delay between chunks
+                ack = ack_every_chunk or i >= last or n % self.WRITE_BARRIER_INTERVAL == 0
+                await self._client.write_gatt_char(
+                    self.WRITE_CHAR_UUID, chunk, response=ack
+                )
+                if self.inter_chunk_delay and i < last:
+                    await asyncio.sleep(self.inter_chunk_delay)
 
             # Wait for write complete notification
-            response = await self._read_response(timeout=60.0)
-            logger.debug("ble_write_response", response=response)
+            reply = await self._read_response(timeout=60.0)
+            self._log.debug("ble_write_response", response=reply)
 
             # Verify if requested
             if verify:
-                logger.info("ble_verifying_write")
-                readback = await self.read_eeprom()
-
+                self._log.info("ble_verifying_write")
+                # Stops at the first differing chunk instead of waiting for
+                # the rest of a read-back that has already failed
+                readback = await self.read_eeprom(expected=data)
+
+                # bytes equality is a single memcmp; only locate the
+                # differing offsets once we know there are some. After an
+                # early stop they cover the bytes read up to that point.
                 if readback != data:
-                    # Find differences
-                    diffs = sum(1 for a, b in zip(data, readback) if a != b)
-                    raise RuntimeError(
-                        f"Verification failed: {diffs} bytes differ. "
-                        "Module may be corrupted!"
+                    raise EEPROMVerificationError(
+                        _diff_offsets(data[: len(readback)], readback)
                     )
 
-                logger.info("ble_write_verified")
+                self._log.info("ble_write_verified", crc32=f"{crc32:08x}")
 
             return True
 
         except Exception as e:
-            logger.error("ble_write_failed", error=str(e))
+            self._log.error("ble_write_failed", error=str(e))
+            raise
+
+    async def _request(self, payload: bytes, timeout: float, op: str) -> bytes:
+        """
+        Send a command and return its (single-notification) reply.
+
+        Args:
+            payload: Encoded command (one of the CMD_* constants)
+            timeout: Response timeout in seconds
+            op: Operation name for the ``ble_<op>_failed`` error event
+
+        Raises:
+            ConnectionError: If not connected
+            TimeoutError: If no response within timeout
+        """
+        try:
+            await self._send_command(payload)
+            return await self._read_response(timeout=timeout)
+        except Exception as e:
+            self._log.error(f"ble_{op}_failed", error=str(e))
             raise
 
     async def erase_eeprom(self) -> None:
@@ -268,17 +494,10 @@ class BLEOperationsService:
             TimeoutError: If operation times out
             RuntimeError: If erase fails
         """
-        logger.info("ble_erasing_eeprom")
-
-        try:
-            await self._send_command("POST /sif/erase")
-            response = await self._read_response(timeout=30.0)
-            logger.debug("ble_erase_response", response=response)
-            logger.info("ble_erase_success")
-
-        except Exception as e:
-            logger.error("ble_erase_failed", error=str(e))
-            raise
+        self._log.info("ble_erasing_eeprom")
+        response = await self._request(self.CMD_ERASE, 30.0, "erase")
+        self._log.debug("ble_erase_response", response=response)
+        self._log.info("ble_erase_success")
 
     async def get_status(self) -> dict:
         """
@@ -294,17 +513,11 @@ class BLEOperationsService:
             ConnectionError: If not connected
             TimeoutError: If operation times out
         """
-        try:
-            await self._send_command("GET /stats")
-            response = await self._read_response(timeout=5.0)
+        response = await self._request(self.CMD_STATS, 5.0, "get_status")
 
-            # TODO: Parse response based on protocol
-            # For now, return raw response
-            return {"raw": response.decode("utf-8", errors="ignore")}
-
-        except Exception as e:
-            logger.error("ble_get_status_failed", error=str(e))
-            raise
+        # TODO: Parse response based on protocol
+        # For now, return raw response
+        return {"raw": response.decode("utf-8", errors="ignore")}
 
     async def get_version(self) -> str:
         """
@@ -320,16 +533,10 @@ class BLEOperationsService:
             ConnectionError: If not connected
             TimeoutError: If operation times out
         """
-        try:
-            await self._send_command("GET /api/1.0/version")
-            response = await self._read_response(timeout=5.0)
-            version = response.decode("utf-8", errors="ignore").strip()
-            logger.info("ble_firmware_version", version=version)
-            return version
-
-        except Exception as e:
-            logger.error("ble_get_version_failed", error=str(e))
-            raise
+        response = await self._request(self.CMD_VERSION, 5.0, "get_version")
+        version = response.decode("utf-8", errors="ignore").strip()
+        self._log.info("ble_firmware_version", version=version)
+        return version
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -0,0 +1,142 @@
+"""Background BLE scanner for SFP Wizard discovery."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import structlog
+from bleak import BleakScanner
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+
+logger = structlog.get_logger(__name__)
+
+
+class BLEScannerService:
+    """
+    Continuously running BLE scanner with an in-memory advertisement cache.
+
+    Keeps a BleakScanner running in the background and records the latest
+    advertisement per device address, so discovery requests can return a
+    snapshot immediately instead of blocking on a fresh 10-second scan.
+
+    Scanning is paused while a device connection is in use (see paused()),
+    since BlueZ connects unreliably while an active scan is running.
+    """
+
+    def __init__(self, max_age: float = 30.0):
+        """
+        Initialize scanner service.
+
+        Args:
+            max_age: Seconds after which a device that stopped advertising
+                is no longer reported
+        """
+        self.max_age = max_age
+        self._scanner: BleakScanner | None = None
+        self._device_cache: dict[str, tuple[BLEDevice, AdvertisementData, float]] = {}
+        # Serializes start/stop/pause transitions of the BleakScanner
+        self._lock = asyncio.Lock()
+        # Number of BLE operations currently holding the scan paused
+        self._pause_count = 0
+
+    async def start(self) -> None:
+        """
+        Start background scanning; does nothing if it is already running.
+
+        Safe to call again after a failure (e.g. the adapter was not ready
+        yet). While paused, scanning begins when the pause ends.
+
+        Raises:
+            Exception: Whatever BleakScanner raises if the adapter is unavailable
+        """
+        async with self._lock:
+            if self._scanner:
+                return
+
+            scanner = BleakScanner(
+                detection_callback=self._on_advert,
+                scanning_mode="active",
+            )
+            if not self._pause_count:
+                await scanner.start()
+            self._scanner = scanner
+
+        logger.info("ble_scanner_started", max_age=self.max_age)
+
+    async def stop(self) -> None:
+        """Stop background scanning and drop cached advertisements."""
+        async with self._lock:
+            if not self._scanner:
+                return
+
+            try:
+                if not self._pause_count:
+                    await self._scanner.stop()
+            finally:
+                self._scanner = None
+                self._device_cache.clear()
+
+        logger.info("ble_scanner_stopped")
+
+    @asynccontextmanager
+    async def paused(self) -> AsyncIterator[None]:
+        """
+        Suspend scanning for the duration of a BLE connection.
+
+        Nested or concurrent pauses are counted; scanning resumes when the
+        last one ends. Cached advertisements are kept meanwhile. If the scan
+        cannot be resumed, the scanner is dropped so the next start() retries.
+        """
+        async with self._lock:
+            self._pause_count += 1
+            if self._pause_count == 1 and self._scanner:
+                try:
+                    await self._scanner.stop()
+                except Exception as e:
+                    logger.warning("ble_scanner_pause_failed", error=str(e))
+        try:
+            yield
+        finally:
+            async with self._lock:
+                self._pause_count -= 1
+                if not self._pause_count and self._scanner:
+                    try:
+                        await self._scanner.start()
+                    except Exception as e:
+                        logger.warning("ble_scanner_resume_failed", error=str(e))
+                        self._scanner = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if background scanning was started (it may be paused)."""
+        return self._scanner is not None
+
+    def _on_advert(self, device: BLEDevice, advertisement_data: AdvertisementData) -> None:
+        """Record the latest advertisement for a device (BleakScanner callback)."""
+        self._device_cache[device.address] = (device, advertisement_data, time.monotonic())
+
+    def get_recent_devices(self) -> list[tuple[BLEDevice, AdvertisementData]]:
+        """
+        Get devices seen within max_age seconds.
+
+        Stale entries are evicted as a side effect so the cache stays bounded
+        by the number of devices currently in range.
+
+        Returns:
+            List of (device, advertisement data) tuples
+        """
+        cutoff = time.monotonic() - self.max_age
+        recent = []
+        stale = []
+        for address, (device, advertisement_data, seen_at) in self._device_cache.items():
+            if seen_at >= cutoff:
+                recent.append((device, advertisement_data))
+            else:
+                stale.append(address)
+
+        for address in stale:
+            del self._device_cache[address]
+
+        return recent
@@ -3,16 +3,90 @@
 import asyncio
 import json
 import os
+import re
 import structlog
+from collections.abc import Sequence
 from typing import Any
 
 import aiohttp
+import ijson
+import orjson
 
 from .ble_tracer import get_tracer
 from .schemas import HABluetoothDevice, HADeviceConnectionResponse
 
 logger = structlog.get_logger(__name__)
 
+# Connection setup bound for all HA calls; the WebSocket stays open
+# indefinitely, so only the REST state dump gets an overall deadline
+_SESSION_TIMEOUT = aiohttp.ClientTimeout(total=None, connect=5)
+_STATES_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=5)
+
+# Decoded WebSocket events waiting for the consumer; the oldest are dropped
+# when a burst outpaces filtering
+_WS_QUEUE_MAXSIZE = 1000
+
+# A repeatedly failing message would otherwise format a full traceback per
+# event; only the first and then every Nth error carry one
+_WS_ERROR_TRACEBACK_EVERY = 100
+
+# Seconds to hold WebSocket device updates so bursts (e.g. RSSI changes) are
+# applied and traced once per device
+_UPDATE_DEBOUNCE = 0.5
+
+# Entity domains that can carry a Bluetooth "source" attribute
+_BLUETOOTH_SOURCE_DOMAINS = ("device_tracker.", "sensor.")
+
+_MAC_SEPARATORS = str.maketrans("", "", ":-_")
+
+
+def _mac_key(mac: str) -> bytes | None:
+    """
+    Canonicalize a MAC address to its 6 raw bytes.
+
+    Accepts any case and ':', '-' or '_' separators, so every spelling of an
+    address maps to the same device cache key. Returns None if mac is not a
+    valid 48-bit address.
+    """
+    try:
+        key = bytes.fromhex(mac.translate(_MAC_SEPARATORS))
+    except ValueError:
+        return None
+    return key if len(key) == 6 else None
+
+def _build_device(
+    mac: str, name: str, attrs: dict[str, Any], last_seen: Any
+) -> HABluetoothDevice | None:
+    """
+    Build a device cache entry from HA entity attributes.
+
+    The entry is created with model_construct (no pydantic validation on the
+    WebSocket hot path), so the fields HA integrations are known to vary on
+    are checked here instead. Returns None if they do not fit the schema.
+    """
+    rssi = attrs.get("rssi", -100)
+    if isinstance(rssi, float) and rssi.is_integer():
+        rssi = int(rssi)
+    source = attrs.get("source", "hass_bluetooth")
+    if (
+        type(rssi) is not int
+        or not isinstance(source, str)
+        or not (last_seen is None or isinstance(last_seen, str))
+    ):
+        return None
+    return HABluetoothDevice.model_construct(
+        mac=mac, name=name, rssi=rssi, source=source, last_seen=last_seen
+    )
+
+
+# Names that identify an SFP Wizard, independent of the configured patterns
+_SFP_WIZARD_NAME_RE = re.compile("sfp|wizard", re.IGNORECASE)
+
+# Known GATT UUIDs for SFP Wizard firmware v1.0.10
+_SFP_SERVICE_UUID = "8E60F02E-F699-4865-B83F-F40501752184"
+_SFP_WRITE_CHAR_UUID = "9280F26C-A56F-43EA-B769-D5D732E1AC67"
+_SFP_NOTIFY_CHAR_UUID = "DC272A22-43F2-416B-8FA5-63A071542FAC"
+
 
 class HomeAssistantBluetoothClient:
     """
@@ -27,7 +101,7 @@ class HomeAssistantBluetoothClient:
         ha_api_url: str | None = None,
         ha_ws_url: str | None = None,
         supervisor_token: str | None = None,
-        device_patterns: list[str] | None = None,
+        device_patterns: Sequence[str] | None = None,
     ):
         """
         Initialize HA Bluetooth client.
@@ -49,12 +123,38 @@ class HomeAssistantBluetoothClient:
         except (json.JSONDecodeError, TypeError):
             default_patterns = ["SFP", "Wizard"]
 
-        self.device_patterns = [p.lower() for p in (device_patterns or default_patterns)]
+        # Lowercased once; every discovered entity name is matched against these
+        self.device_patterns = tuple(p.lower() for p in (device_patterns or default_patterns))
+        # One compiled alternation scans a name for all patterns in a single
+        # pass; with no patterns configured, nothing matches
+        name_pattern = "|".join(map(re.escape, self.device_patterns)) or "(?!)"
+        # ASCII patterns (the usual case) are matched against the UTF-8 bytes
+        # of a name, where IGNORECASE is a plain ASCII fold instead of a
+        # Unicode case lookup; non-ASCII bytes can never match them anyway
+        self._match_bytes = name_pattern.isascii()
+        if self._match_bytes:
+            self._name_re = re.compile(name_pattern.encode(), re.IGNORECASE)
+        else:
+            self._name_re = re.compile(name_pattern, re.IGNORECASE)
 
         self._session: aiohttp.ClientSession | None = None
         self._ws: aiohttp.ClientWebSocketResponse | None = None
-        self._discovered_devices: dict[str, HABluetoothDevice] = {}
+        # Keyed by _mac_key(); HABluetoothDevice.mac holds the display form
+        self._discovered_devices: dict[bytes, HABluetoothDevice] = {}
+        # Immutable view of _discovered_devices, rebuilt lazily after each
+        # change; handed out as-is, so callers cannot alter the cache through it
+        self._devices_snapshot: tuple[HABluetoothDevice, ...] | None = None
+        # MAC derived from each entity ID (None if it has none); entity IDs are
+        # stable, so this is computed once per entity
+        self._mac_cache: dict[str, bytes | None] = {}
         self._ws_task: asyncio.Task | None = None
+        self._ws_queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._consumer_task: asyncio.Task | None = None
+        self._ws_error_count = 0
+        # Latest WebSocket update per device (with its entity ID) awaiting the
+        # debounced flush into _discovered_devices
+        self._pending_updates: dict[bytes, tuple[HABluetoothDevice, str]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
         self._connected = False
 
         token_len = len(self.supervisor_token or "")
@@ -83,14 +183,25 @@ class HomeAssistantBluetoothClient:
 
         logger.info("ha_bluetooth_client_starting")
 
-        # Create session with auth header
+        # Create session with auth header. The REST and WebSocket calls all go
+        # to the same host, so keep idle connections around for reuse rather
+        # than reconnecting for every discovery or WebSocket reconnect.
         headers = {"Authorization": f"Bearer {self.supervisor_token}"}
-        self._session = aiohttp.ClientSession(headers=headers)
+        connector = aiohttp.TCPConnector(
+            limit=10, keepalive_timeout=300, enable_cleanup_closed=True
+        )
+        self._session = aiohttp.ClientSession(
+            headers=headers, connector=connector, timeout=_SESSION_TIMEOUT
+        )
 
         # Initial device discovery
         await self._discover_devices()
 
         # Start WebSocket listener for real-time updates
+        # The listener only reads and decodes frames; filtering and tracing run
+        # in a separate consumer so the socket keeps draining during bursts
+        self._ws_queue = asyncio.Queue(maxsize=_WS_QUEUE_MAXSIZE)
+        self._consumer_task = asyncio.create_task(self._consume_ws_messages())
         self._ws_task = asyncio.create_task(self._websocket_listener())
 
         self._connected = True
@@ -101,12 +212,16 @@ class HomeAssistantBluetoothClient:
         logger.info("ha_bluetooth_client_stopping")
 
         # Cancel WebSocket listener
-        if self._ws_task:
-            self._ws_task.cancel()
-            try:
-                await self._ws_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._ws_task, self._consumer_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        # Apply any debounced updates still waiting
+        self._flush_now()
 
         # Close WebSocket
         if self._ws:
@@ -121,16 +236,24 @@ class HomeAssistantBluetoothClient:
         self._connected = False
         logger.info("ha_bluetooth_client_stopped")
 
-    async def get_bluetooth_devices(self) -> list[HABluetoothDevice]:
+    async def get_bluetooth_devices(self) -> tuple[HABluetoothDevice, ...]:
         """
         Get all Bluetooth devices from HA that match configured patterns.
 
         Returns:
-            List of discovered devices matching configured patterns
+            Tuple of discovered devices matching configured patterns
         """
         # Return cached devices populated at startup and refreshed via the
-        # WebSocket listener. This avoids hitting the HA API on every request.
-        return list(self._discovered_devices.values())
+        # WebSocket listener. This avoids hitting the HA API on every request;
+        # the tuple itself is only rebuilt after the device cache changes.
+        if self._devices_snapshot is None:
+            self._devices_snapshot = tuple(self._discovered_devices.values())
+        return self._devices_snapshot
+
+    @property
+    def device_count(self) -> int:
+        """Number of currently discovered devices matching configured patterns."""
+        return len(self._discovered_devices)
 
     async def connect_to_device(self, mac_address: str) -> HADeviceConnectionResponse:
         """
@@ -152,47 +275,38 @@ class HomeAssistantBluetoothClient:
         """
         logger.info("ha_bluetooth_connecting", mac=mac_address)
 
-        # Normalize MAC
-        mac_address = mac_address.upper().replace("-", ":")
-
-        # Check if device is discovered
-        device = self._discovered_devices.get(mac_address)
+        # Normalize MAC once; any case or separator style finds the device
+        mac_key = _mac_key(mac_address)
+        device = self._discovered_devices.get(mac_key) if mac_key else None
         if not device:
             raise ValueError(
                 f"Device {mac_address} not found. "
                 "Make sure the device is advertising and matches configured patterns."
             )
+        mac_address = device.mac  # Canonical AA:BB:CC:DD:EE:FF form
 
         # Check if this is an SFP Wizard device (matches our patterns)
-        is_sfp_wizard = any(
-            pattern.lower() in device.name.lower()
-            for pattern in ["sfp", "wizard"]
-        )
+        is_sfp_wizard = _SFP_WIZARD_NAME_RE.search(device.name) is not None
 
         if is_sfp_wizard:
             # Return known UUIDs for SFP Wizard firmware v1.0.10
             logger.info("ha_bluetooth_sfp_wizard_detected", device_name=device.name)
 
-            # Known UUIDs from firmware v1.0.10
-            service_uuid = "8E60F02E-F699-4865-B83F-F40501752184"
-            write_char_uuid = "9280F26C-A56F-43EA-B769-D5D732E1AC67"
-            notify_char_uuid = "DC272A22-43F2-416B-8FA5-63A071542FAC"
-
             tracer = get_tracer()
             tracer.log_connection_established(
                 mac=mac_address,
                 name=device.name,
-                service_uuid=service_uuid,
-                write_uuid=write_char_uuid,
-                notify_uuid=notify_char_uuid,
+                service_uuid=_SFP_SERVICE_UUID,
+                write_uuid=_SFP_WRITE_CHAR_UUID,
+                notify_uuid=_SFP_NOTIFY_CHAR_UUID,
             )
 
             return HADeviceConnectionResponse(
                 mac=mac_address,
                 name=device.name,
-                service_uuid=service_uuid,
-                write_char_uuid=write_char_uuid,
-                notify_char_uuid=notify_char_uuid,
+                service_uuid=_SFP_SERVICE_UUID,
+                write_char_uuid=_SFP_WRITE_CHAR_UUID,
+                notify_char_uuid=_SFP_NOTIFY_CHAR_UUID,
             )
         else:
             # For non-SFP Wizard devices, we cannot auto-detect UUIDs via HA API
@@ -222,98 +336,116 @@ class HomeAssistantBluetoothClient:
         )
 
         try:
-            async with self._session.get(f"{self.ha_api_url}/states") as resp:
+            async with self._session.get(
+                f"{self.ha_api_url}/states", timeout=_STATES_TIMEOUT
+            ) as resp:
                 if resp.status != 200:
                     logger.error("ha_bluetooth_states_fetch_failed", status=resp.status)
                     return
 
-                states = await resp.json()
-
-            # Process states to find Bluetooth devices
-            discovered = {}
-            for state in states:
-                entity_id = state.get("entity_id", "")
-                attrs = state.get("attributes", {})
-
-                # Look for bluetooth-related entities
-                # This includes device_tracker from bluetooth, sensor entities, etc.
-                if not self._is_bluetooth_entity(entity_id, attrs):
-                    continue
-
-                name = attrs.get("friendly_name", "")
-
-                # Pattern matching (case-insensitive)
-                if not any(pattern in name.lower() for pattern in self.device_patterns):
-                    continue
-
-                # Extract MAC from various attribute locations
-                mac = self._extract_mac(attrs, entity_id)
-                if not mac:
-                    continue
-
-                # Create device object
-                device = HABluetoothDevice(
-                    mac=mac,
-                    name=name,
-                    rssi=attrs.get("rssi", -100),
-                    source=attrs.get("source", "hass_bluetooth"),
-                    last_seen=state.get("last_changed"),
-                )
-                discovered[mac] = device
+                # Stream-parse the state dump (megabytes on large installs)
+                # so only the few Bluetooth entities are ever kept in memory
+                discovered = {}
+                async for state in ijson.items(resp.content, "item", use_float=True):
+                    entity_id = state.get("entity_id", "")
+                    attrs = state.get("attributes", {})
 
-                # Log discovery to tracer
-                tracer.log_device_discovered(
-                    mac=mac,
-                    name=name,
-                    rssi=attrs.get("rssi", -100),
-                    advertisement_data={
-                        "entity_id": entity_id,
-                        "source": attrs.get("source", "hass_bluetooth"),
-                        "last_seen": state.get("last_changed"),
-                        "attributes": attrs,
-                    }
-                )
+                    # Look for bluetooth-related entities
+                    # This includes device_tracker from bluetooth, sensor entities, etc.
+                    if not self._is_bluetooth_entity(entity_id, attrs):
+                        continue
+
+                    name = attrs.get("friendly_name", "")
+
+                    # Pattern matching (case-insensitive)
+                    if not self._matches_patterns(name):
+                        continue
+
+                    # Extract MAC from various attribute locations
+                    mac_key = self._extract_mac(attrs, entity_id)
+                    if not mac_key:
+                        continue
+                    mac = mac_key.hex(":").upper()
+
+                    device = _build_device(mac, name, attrs, state.get("last_changed"))
+                    if device is None:
+                        logger.debug("ha_bluetooth_entity_invalid", entity_id=entity_id)
+                        continue
+                    discovered[mac_key] = device
+
+                    # Log discovery to tracer (advertisement data is only
+                    # built when tracing is on)
+                    if tracer.enabled:
+                        tracer.log_device_discovered(
+                            mac=mac,
+                            name=name,
+                            rssi=device.rssi,
+                            advertisement_data={
+                                "entity_id": entity_id,
+                                "source": device.source,
+                                "last_seen": device.last_seen,
+                                "attributes": attrs,
+                            }
+                        )
 
             # Update cache
             self._discovered_devices = discovered
+            self._devices_snapshot = None
             logger.debug("ha_bluetooth_devices_discovered", count=len(discovered))
 
         except Exception as e:
             logger.error("ha_bluetooth_discovery_error", error=str(e), exc_info=True)
             tracer.log_error("Device Discovery", str(e))
 
-    def _is_bluetooth_entity(self, entity_id: str, attrs: dict[str, Any]) -> bool:
+    def _matches_patterns(self, name: str) -> bool:
+        """Check if a device name contains any configured pattern (case-insensitive)."""
+        if not name or not isinstance(name, str):
+            return False
+        if self._match_bytes:
+            return self._name_re.search(name.encode("utf-8", "replace")) is not None
+        return self._name_re.search(name) is not None
+
+    @staticmethod
+    def _is_bluetooth_entity(entity_id: str, attrs: dict[str, Any]) -> bool:
         """Check if entity is Bluetooth-related."""
-        # Check entity domain
-        if entity_id.startswith(("device_tracker.", "sensor.")):
-            # Check for bluetooth source attribute
-            source = attrs.get("source", "")
-            if "bluetooth" in source.lower() or "ble" in source.lower():
-                return True
-
-        # Check for bluetooth in entity ID
-        if "bluetooth" in entity_id or "ble" in entity_id:
+        # Check for bluetooth in entity ID first; needs no attribute lookup
+        if "ble" in entity_id or "bluetooth" in entity_id:
             return True
 
+        # Otherwise a tracker/sensor whose source is a Bluetooth integration
+        if entity_id.startswith(_BLUETOOTH_SOURCE_DOMAINS):
+            source = attrs.get("source")
+            if source and isinstance(source, str):
+                source = source.lower()
+                return "ble" in source or "bluetooth" in source
+
         return False
 
-    def _extract_mac(self, attrs: dict[str, Any], entity_id: str) -> str | None:
-        """Extract MAC address from entity attributes."""
+    def _extract_mac(self, attrs: dict[str, Any], entity_id: str) -> bytes | None:
+        """Extract MAC address from entity attributes, as a _mac_key() key."""
         # Try common attribute names
-        for key in ["address", "mac", "mac_address", "id"]:
+        for key in ("address", "mac", "mac_address", "id"):
             mac = attrs.get(key)
             if mac and ":" in str(mac):
-                return str(mac).upper()
+                mac_key = _mac_key(str(mac))
+                if mac_key:
+                    return mac_key
 
         # Try to extract from entity ID (some integrations use MAC in entity ID)
         # e.g., device_tracker.aa_bb_cc_dd_ee_ff
+        try:
+            return self._mac_cache[entity_id]
+        except KeyError:
+            pass
+
+        mac = None
         parts = entity_id.split(".")
         if len(parts) == 2:
-            potential_mac = parts[1].replace("_", ":")
-            if potential_mac.count(":") == 5:  # Valid MAC format
-                return potential_mac.upper()
+            if parts[1].count("_") == 5:  # aa_bb_cc_dd_ee_ff
+                mac = _mac_key(parts[1])
 
-        return None
+        self._mac_cache[entity_id] = mac
+        return mac
 
     async def _websocket_listener(self) -> None:
         """Listen for Bluetooth device updates via WebSocket with auto-reconnection."""
@@ -333,7 +465,7 @@ class HomeAssistantBluetoothClient:
                 auth_ok = False
                 # Read up to 3 initial messages to complete handshake
                 for _ in range(3):
-                    msg = await self._ws.receive_json()
+                    msg = await self._ws.receive_json(loads=orjson.loads)
                     mtype = msg.get("type")
                     if mtype == "auth_required":
                         # Send credentials
@@ -367,15 +499,15 @@ class HomeAssistantBluetoothClient:
                 async for msg in self._ws:
                     if msg.type == aiohttp.WSMsgType.TEXT:
                         try:
-                            data = json.loads(msg.data)
-                            await self._handle_ws_message(data)
+                            self._enqueue_ws_message(orjson.loads(msg.data))
                         except Exception as e:
-                            logger.error("ha_bluetooth_websocket_message_error", error=str(e), exc_info=True)
+                            self._log_ws_message_error(e)
                     elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
                         logger.warning("ha_bluetooth_websocket_closed", msg_type=str(msg.type))
                         break
 
                 # Connection closed, attempt reconnection
+                self._flush_now()
                 retry_count += 1
                 if retry_count < max_retries:
                     delay = base_delay * (2 ** retry_count)  # Exponential backoff
@@ -387,6 +519,7 @@ class HomeAssistantBluetoothClient:
                 raise
             except Exception as e:
                 logger.error("ha_bluetooth_websocket_error", error=str(e), exc_info=True)
+                self._flush_now()
                 retry_count += 1
                 if retry_count < max_retries:
                     delay = base_delay * (2 ** retry_count)
@@ -395,6 +528,35 @@ class HomeAssistantBluetoothClient:
                     
         logger.error("ha_bluetooth_websocket_max_retries_exceeded")
 
+    def _enqueue_ws_message(self, data: dict[str, Any]) -> None:
+        """Hand a decoded message to the consumer, dropping the oldest if full."""
+        try:
+            self._ws_queue.put_nowait(data)
+        except asyncio.QueueFull:
+            self._ws_queue.get_nowait()
+            self._ws_queue.put_nowait(data)
+            logger.debug("ha_bluetooth_websocket_queue_full", dropped=1)
+
+    async def _consume_ws_messages(self) -> None:
+        """Process queued WebSocket messages until cancelled."""
+        while True:
+            data = await self._ws_queue.get()
+            try:
+                await self._handle_ws_message(data)
+            except Exception as e:
+                self._log_ws_message_error(e)
+
+    def _log_ws_message_error(self, error: Exception) -> None:
+        """Log a per-message error, with a traceback only every Nth time."""
+        self._ws_error_count += 1
+        logger.error(
+            "ha_bluetooth_websocket_message_error",
+            error_type=type(error).__name__,
+            error=str(error),
+            error_count=self._ws_error_count,
+            exc_info=self._ws_error_count % _WS_ERROR_TRACEBACK_EVERY == 1,
+        )
+
     async def _handle_ws_message(self, data: dict[str, Any]) -> None:
         """Process WebSocket message for Bluetooth device updates."""
         # Check for state_changed event
@@ -404,7 +566,20 @@ class HomeAssistantBluetoothClient:
         ):
             event_data = data.get("event", {}).get("data", {})
             entity_id = event_data.get("entity_id", "")
-            new_state = event_data.get("new_state", {})
+
+            # Most events (lights, climate, ...) can be rejected from the
+            # entity ID alone, before touching the new state
+            if not (
+                entity_id.startswith(_BLUETOOTH_SOURCE_DOMAINS)
+                or "ble" in entity_id
+                or "bluetooth" in entity_id
+            ):
+                return
+
+            # new_state is null when an entity is removed
+            new_state = event_data.get("new_state")
+            if not new_state:
+                return
             attrs = new_state.get("attributes", {})
 
             # Only process bluetooth entities
@@ -414,36 +589,58 @@ class HomeAssistantBluetoothClient:
             name = attrs.get("friendly_name", "")
 
             # Pattern matching
-            if not any(pattern in name.lower() for pattern in self.device_patterns):
+            if not self._matches_patterns(name):
                 return
 
             # Extract MAC
-            mac = self._extract_mac(attrs, entity_id)
-            if not mac:
+            mac_key = self._extract_mac(attrs, entity_id)
+            if not mac_key:
                 return
+            mac = mac_key.hex(":").upper()
 
-            # Update cache
-            device = HABluetoothDevice(
-                mac=mac,
-                name=name,
-                rssi=attrs.get("rssi", -100),
-                source=attrs.get("source", "hass_bluetooth"),
-                last_seen=new_state.get("last_changed"),
-            )
-            self._discovered_devices[mac] = device
+            # Queue the update; only the latest one per device within the
+            # debounce window reaches the cache and the tracer
+            device = _build_device(mac, name, attrs, new_state.get("last_changed"))
+            if device is None:
+                logger.debug("ha_bluetooth_entity_invalid", entity_id=entity_id)
+                return
+            self._pending_updates[mac_key] = (device, entity_id)
+            if self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    _UPDATE_DEBOUNCE, self._flush_pending_updates
+                )
 
-            # Log to tracer
-            tracer = get_tracer()
-            tracer.log_device_discovered(
-                mac=mac,
-                name=name,
-                rssi=attrs.get("rssi", -100),
-                advertisement_data={
-                    "entity_id": entity_id,
-                    "source": attrs.get("source", "hass_bluetooth"),
-                    "last_seen": new_state.get("last_changed"),
-                    "update_via": "websocket",
-                }
-            )
+    def _flush_now(self) -> None:
+        """Cancel the debounce timer and apply pending updates immediately."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_pending_updates()
+
+    def _flush_pending_updates(self) -> None:
+        """Apply debounced WebSocket updates to the device cache and tracer."""
+        self._flush_handle = None
+        pending, self._pending_updates = self._pending_updates, {}
+        if not pending:
+            return
+
+        self._discovered_devices.update(
+            (mac_key, device) for mac_key, (device, _) in pending.items()
+        )
+        self._devices_snapshot = None
 
-            logger.debug(f"Updated device via WebSocket: {name} ({mac})")
+        # Log to tracer
+        tracer = get_tracer()
+        for device, entity_id in pending.values():
+            if tracer.enabled:
+                tracer.log_device_discovered(
+                    mac=device.mac,
+                    name=device.name,
+                    rssi=device.rssi,
+                    advertisement_data={
+                        "entity_id": entity_id,
+                        "source": device.source,
+                        "last_seen": device.last_seen,
+                        "update_via": "websocket",
+                    }
+                )
+            logger.debug(f"Updated device via WebSocket: {device.name} ({device.mac})")
@@ -1,9 +1,8 @@
 """Business logic for SFP module operations."""
 
-import hashlib
-
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.hashing import sha256_hex
 from app.models.module import SFPModule
 from app.repositories.module_repository import ModuleRepository
 from app.services.sfp_parser import parse_sfp_data
@@ -28,7 +27,7 @@ class ModuleService:
             Tuple of (module, is_duplicate)
         """
         # Compute SHA-256 checksum
-        sha256 = hashlib.sha256(eeprom_data).hexdigest()
+        sha256 = sha256_hex(eeprom_data)
 
         # Check for existing module with same checksum
         existing = await self.repository.get_by_sha256(sha256)
@@ -1,5 +1,20 @@
 """SFP EEPROM data parser based on SFF-8472 standard."""
 
+import string
+
+# (field, start, end) offsets of the ASCII identification fields in page A0h
+_ASCII_FIELDS = (
+    ("vendor", 20, 36),
+    ("model", 40, 56),
+    ("serial", 68, 84),
+)
+
+# Fields are space padded per spec; blank EEPROMs are NUL filled instead
+_PADDING = string.whitespace + "\x00"
+
+_UNKNOWN = {field: "Unknown" for field, _, _ in _ASCII_FIELDS}
+_PARSE_ERROR = {field: "Parse Error" for field, _, _ in _ASCII_FIELDS}
+
 
 def parse_sfp_data(eeprom_data: bytes) -> dict[str, str]:
     """
@@ -17,25 +32,14 @@ def parse_sfp_data(eeprom_data: bytes) -> dict[str, str]:
         Dictionary with vendor, model, and serial keys
     """
     if len(eeprom_data) < 96:
-        return {
-            "vendor": "Unknown",
-            "model": "Unknown",
-            "serial": "Unknown",
-        }
+        return dict(_UNKNOWN)
 
     try:
-        vendor = eeprom_data[20:36].decode("ascii", errors="ignore").strip()
-        model = eeprom_data[40:56].decode("ascii", errors="ignore").strip()
-        serial = eeprom_data[68:84].decode("ascii", errors="ignore").strip()
-
+        # Single pass over the fixed field layout; one decode per field
+        view = memoryview(eeprom_data)
         return {
-            "vendor": vendor or "N/A",
-            "model": model or "N/A",
-            "serial": serial or "N/A",
+            field: str(view[start:end], "ascii", "ignore").strip(_PADDING) or "N/A"
+            for field, start, end in _ASCII_FIELDS
         }
     except Exception:
-        return {
-            "vendor": "Parse Error",
-            "model": "Parse Error",
-            "serial": "Parse Error",
-        }
+        return dict(_PARSE_ERROR)
@@ -1,28 +1,67 @@
 """Pytest configuration and fixtures for SFPLiberate backend tests."""
 
+import logging
+
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
 
-from app.core.database import Base
+from app.models.module import Base
 
 
-@pytest.fixture
-async def db_session():
-    """Create a test database session."""
+@pytest.fixture(scope="session")
+async def db_engine():
+    """Create the in-memory test database and its schema once per test run."""
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
     )
 
+    # Let SQLAlchemy emit BEGIN itself; the sqlite3 driver's implicit
+    # transaction handling otherwise breaks the SAVEPOINTs db_session uses
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-
-    async with async_session() as session:
-        yield session
+    yield engine
 
     await engine.dispose()
+
+
+@pytest.fixture
+async def db_session(db_engine):
+    """
+    Create a test database session isolated in a rolled-back transaction.
+
+    Commits inside the test only release a SAVEPOINT, so every test starts
+    from the empty schema without re-running create_all.
+    """
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+@pytest.fixture
+def restore_logging():
+    """Put back the root logger's handlers and level after setup_logging()."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    root.handlers[:] = handlers
+    root.setLevel(level)
@@ -0,0 +1,65 @@
+"""Tests for the database backup service."""
+
+import sqlite3
+
+import pytest
+
+from app.services.backup_service import BACKUP_PREFIX, DatabaseBackupService
+
+
+def _names(db_file) -> list[str]:
+    with sqlite3.connect(db_file) as conn:
+        return [row[0] for row in conn.execute("SELECT name FROM modules ORDER BY name")]
+
+
+@pytest.fixture
+def live_db(tmp_path):
+    """A WAL-mode database with an open connection holding uncheckpointed commits."""
+    db_file = tmp_path / "sfp_library.db"
+    conn = sqlite3.connect(db_file)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA wal_autocheckpoint=0")
+    conn.execute("CREATE TABLE modules (name TEXT)")
+    conn.execute("INSERT INTO modules VALUES ('original')")
+    conn.commit()
+    yield db_file, conn
+    conn.close()
+
+
+@pytest.fixture
+def service(tmp_path, live_db):
+    backup_service = DatabaseBackupService(max_backups=7)
+    backup_service.db_file = live_db[0]
+    backup_service.backup_dir = tmp_path / "backups"
+    backup_service.backup_dir.mkdir()
+    return backup_service
+
+
+async def test_backup_and_restore_live_database(service, live_db):
+    """A backup of a live WAL database restores its committed content."""
+    db_file, conn = live_db
+
+    backup_path = await service.create_backup()
+
+    assert backup_path is not None
+    assert backup_path.name.startswith(BACKUP_PREFIX)
+    assert _names(backup_path) == ["original"]
+
+    conn.execute("DELETE FROM modules")
+    conn.execute("INSERT INTO modules VALUES ('changed')")
+    conn.commit()
+
+    assert await service.restore_backup(backup_path.name) is True
+
+    assert _names(db_file) == ["original"]
+    # The state replaced by the restore is kept as a pre-restore backup
+    pre_restore = [
+        backup["name"] for backup in await service.list_backups() if "pre_restore" in backup["name"]
+    ]
+    assert len(pre_restore) == 1
+    assert _names(service.backup_dir / pre_restore[0]) == ["changed"]
+
+
+async def test_restore_missing_backup_fails(service):
+    """Restoring a backup that does not exist reports failure."""
+    assert await service.restore_backup(f"{BACKUP_PREFIX}missing.db") is False
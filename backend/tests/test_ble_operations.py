@@ -0,0 +1,272 @@
+"""Tests for SFP Wizard BLE operations, against a fake GATT client."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.ble_operations import BLEOperationsService, EEPROMVerificationError
+
+EEPROM = bytes(range(256))
+
+
+class FakeSFPWizard:
+    """
+    Stands in for a connected BleakClient talking to an SFP Wizard.
+
+    Replies are delivered as separate notifications, one per event loop
+    iteration, the way bleak invokes the notification callback.
+    """
+
+    def __init__(self, replies: dict[bytes, list[bytes]] | None = None):
+        self.is_connected = True
+        self.replies = replies or {}
+        self.callback = None
+
+    def notify(self, *parts: bytes) -> None:
+        loop = asyncio.get_running_loop()
+
+        def deliver(index: int) -> None:
+            if index < len(parts):
+                self.callback(0, bytearray(parts[index]))
+                loop.call_soon(deliver, index + 1)
+
+        loop.call_soon(deliver, 0)
+
+    async def write_gatt_char(self, char_uuid, data, response=False) -> None:
+        self.notify(*self.replies.get(bytes(data), ()))
+
+
+class FakeEEPROMDevice(FakeSFPWizard):
+    """Fake SFP Wizard that stores written EEPROM data, with optional bit errors."""
+
+    def __init__(self, corrupt: dict[int, int] | None = None):
+        super().__init__()
+        self.corrupt = corrupt or {}
+        self.eeprom = b""
+        self._incoming: bytearray | None = None
+        # (payload, response flag) of every GATT write
+        self.writes: list[tuple[bytes, bool]] = []
+
+    async def write_gatt_char(self, char_uuid, data, response=False) -> None:
+        data = bytes(data)
+        self.writes.append((data, response))
+        if data == BLEOperationsService.CMD_WRITE:
+            self._incoming = bytearray()
+        elif data == BLEOperationsService.CMD_READ_START:
+            self.notify(*_fragments(self.eeprom))
+        elif self._incoming is not None:
+            self._incoming += data
+            if len(self._incoming) == len(EEPROM):
+                for offset, value in self.corrupt.items():
+                    self._incoming[offset] = value
+                self.eeprom, self._incoming = bytes(self._incoming), None
+                self.notify(b"OK")
+
+
+def _fragments(data: bytes, size: int = 20) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def _service(client: FakeSFPWizard) -> BLEOperationsService:
+    service = BLEOperationsService("AA:BB:CC:DD:EE:FF")
+    service._client = client
+    client.callback = service._notification_callback
+    return service
+
+
+async def test_read_eeprom_assembles_fragmented_notifications():
+    """A 256-byte image split across notifications is joined in order."""
+    client = FakeSFPWizard({BLEOperationsService.CMD_READ_START: _fragments(EEPROM)})
+    service = _service(client)
+    chunks = []
+
+    data = await service.read_eeprom(on_chunk=chunks.append)
+
+    assert data == EEPROM
+    assert b"".join(chunks) == EEPROM
+
+
+async def test_read_response_completes_at_expected_length():
+    """The read returns at exactly expected_len; later notifications are dropped."""
+    client = FakeSFPWizard({BLEOperationsService.CMD_READ_START: _fragments(EEPROM)})
+    service = _service(client)
+
+    await service._send_command(BLEOperationsService.CMD_READ_START)
+    data = await service._read_response(timeout=1.0, expected_len=256)
+    client.notify(b"late")
+    await asyncio.sleep(0)
+
+    assert data == EEPROM
+    assert service._response_len == 0
+
+
+async def test_read_response_discards_overflowing_response():
+    """Data beyond MAX_RESPONSE_SIZE is discarded rather than returned."""
+    client = FakeSFPWizard({BLEOperationsService.CMD_STATS: [bytes(40), bytes(40)]})
+    service = _service(client)
+    service.MAX_RESPONSE_SIZE = 64
+
+    await service._send_command(BLEOperationsService.CMD_STATS)
+    with pytest.raises(TimeoutError, match="Response timeout"):
+        await service._read_response(timeout=0.05, expected_len=80)
+
+    assert service._response_len == 0
+
+
+async def test_read_response_times_out_on_incomplete_data():
+    """A response that stops short of expected_len reports what arrived."""
+    client = FakeSFPWizard({BLEOperationsService.CMD_READ_START: _fragments(EEPROM[:100])})
+    service = _service(client)
+
+    await service._send_command(BLEOperationsService.CMD_READ_START)
+    with pytest.raises(TimeoutError, match="got 100 of 256 bytes"):
+        await service._read_response(timeout=0.05, expected_len=256)
+
+
+async def test_read_response_times_out_without_data():
+    """No notification at all within the timeout raises TimeoutError."""
+    service = _service(FakeSFPWizard())
+
+    await service._send_command(BLEOperationsService.CMD_STATS)
+    with pytest.raises(TimeoutError, match="Response timeout after 0.05s"):
+        await service._read_response(timeout=0.05)
+
+
+@pytest.mark.parametrize(
+    ("flags", "command_acked", "chunk_acks"),
+    [
+        ({}, False, [False, False, False, True] * 3 + [True]),
+        ({"ack_command": True}, True, [False, False, False, True] * 3 + [True]),
+        ({"ack_every_chunk": True}, False, [True] * 13),
+    ],
+)
+async def test_write_eeprom_ack_flags(flags, command_acked, chunk_acks):
+    """ack_command covers the write command only; ack_every_chunk the data."""
+    device = FakeEEPROMDevice()
+    service = _service(device)
+
+    await service.write_eeprom(EEPROM, verify=False, **flags)
+
+    command, *chunks = device.writes
+    assert command == (BLEOperationsService.CMD_WRITE, command_acked)
+    assert [ack for _, ack in chunks] == chunk_acks
+
+
+def _record_readbacks(service: BLEOperationsService) -> list[bytes]:
+    """Capture what each read_eeprom call returned."""
+    readbacks = []
+    read_eeprom = service.read_eeprom
+
+    async def recording_read_eeprom(**kwargs) -> bytes:
+        data = await read_eeprom(**kwargs)
+        readbacks.append(data)
+        return data
+
+    service.read_eeprom = recording_read_eeprom
+    return readbacks
+
+
+async def test_write_eeprom_verifies_readback():
+    """A faithful write passes verification after a full read-back."""
+    device = FakeEEPROMDevice()
+    service = _service(device)
+
+    assert await service.write_eeprom(EEPROM) is True
+    assert device.eeprom == EEPROM
+
+
+async def test_write_verification_stops_at_first_chunk_mismatch():
+    """A difference in the first chunk ends the read-back early."""
+    service = _service(FakeEEPROMDevice(corrupt={3: 0xFF, 5: 0x00}))
+    readbacks = _record_readbacks(service)
+
+    with pytest.raises(EEPROMVerificationError) as exc_info:
+        await service.write_eeprom(EEPROM)
+
+    assert exc_info.value.diff_offsets == [3, 5]
+    assert len(readbacks[0]) == 20
+
+
+async def test_write_verification_reports_last_chunk_mismatch():
+    """A difference in the last chunk is found after the full read-back."""
+    service = _service(FakeEEPROMDevice(corrupt={250: 0x00}))
+    readbacks = _record_readbacks(service)
+
+    with pytest.raises(EEPROMVerificationError) as exc_info:
+        await service.write_eeprom(EEPROM)
+
+    assert exc_info.value.diff_offsets == [250]
+    assert len(readbacks[0]) == 256
+
+
+@pytest.mark.parametrize(
+    ("mtu_size", "char_write_size", "expected"),
+    [
+        (23, 244, 244),  # Characteristic reports the negotiated MTU
+        (23, 20, 20),  # Nothing negotiated (or BlueZ < 5.62)
+        (185, None, 182),  # Write characteristic not discovered
+        (23, None, 20),
+    ],
+)
+def test_negotiate_mtu_sizes_writes(mtu_size, char_write_size, expected):
+    """Write chunks follow the characteristic, falling back to the MTU."""
+    char = (
+        None
+        if char_write_size is None
+        else SimpleNamespace(max_write_without_response_size=char_write_size)
+    )
+    client = SimpleNamespace(
+        mtu_size=mtu_size,
+        services=SimpleNamespace(get_characteristic=lambda uuid: char),
+    )
+    service = BLEOperationsService("AA:BB:CC:DD:EE:FF")
+    service._client = client
+
+    service._negotiate_mtu()
+
+    assert service._mtu_payload == expected
+
+
+class FakeTeardownClient:
+    """Records teardown calls; stop_notify fails if the link is already down."""
+
+    def __init__(self, fail_stop_notify: bool = False):
+        self.is_connected = True
+        self.fail_stop_notify = fail_stop_notify
+        self.calls: list[str] = []
+
+    async def stop_notify(self, char_uuid) -> None:
+        self.calls.append("stop_notify")
+        await asyncio.sleep(0)
+        if self.fail_stop_notify or not self.is_connected:
+            raise OSError("not connected")
+
+    async def disconnect(self) -> None:
+        self.calls.append("disconnect")
+        self.is_connected = False
+
+
+async def test_disconnect_stops_notifications_first(capsys):
+    """stop_notify completes before disconnect, so no teardown error is logged."""
+    client = FakeTeardownClient()
+    service = BLEOperationsService("AA:BB:CC:DD:EE:FF")
+    service._client = client
+
+    await service.disconnect()
+
+    assert client.calls == ["stop_notify", "disconnect"]
+    assert service._client is None
+    assert "ble_disconnect_error" not in capsys.readouterr().out
+
+
+async def test_disconnect_still_disconnects_after_stop_notify_error():
+    """A failing stop_notify does not leave the link up."""
+    client = FakeTeardownClient(fail_stop_notify=True)
+    service = BLEOperationsService("AA:BB:CC:DD:EE:FF")
+    service._client = client
+
+    await service.disconnect()
+
+    assert client.calls == ["stop_notify", "disconnect"]
+    assert not client.is_connected
@@ -0,0 +1,76 @@
+"""Tests for the background BLE scanner lifecycle."""
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1 import bluetooth
+from app.services import ble_scanner
+from app.services.ble_scanner import BLEScannerService
+
+
+class FakeBleakScanner:
+    """Records start/stop calls; the first start can be made to fail."""
+
+    calls: list[str] = []
+    fail_next_start = False
+
+    def __init__(self, detection_callback=None, scanning_mode="active"):
+        self.detection_callback = detection_callback
+
+    async def start(self) -> None:
+        if FakeBleakScanner.fail_next_start:
+            FakeBleakScanner.fail_next_start = False
+            raise OSError("adapter not ready")
+        self.calls.append("start")
+
+    async def stop(self) -> None:
+        self.calls.append("stop")
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Swap BleakScanner for the fake and return its call log."""
+    monkeypatch.setattr(ble_scanner, "BleakScanner", FakeBleakScanner)
+    monkeypatch.setattr(FakeBleakScanner, "calls", [])
+    monkeypatch.setattr(FakeBleakScanner, "fail_next_start", False)
+    return FakeBleakScanner.calls
+
+
+async def test_discover_dependency_retries_failed_start(calls, monkeypatch):
+    """A scanner that failed at startup is started by a later request."""
+    scanner = BLEScannerService()
+    monkeypatch.setattr(bluetooth, "_ble_scanner", scanner)
+    FakeBleakScanner.fail_next_start = True
+
+    with pytest.raises(HTTPException) as exc_info:
+        await bluetooth.get_ble_scanner()
+    assert exc_info.value.status_code == 503
+
+    assert await bluetooth.get_ble_scanner() is scanner
+    assert scanner.is_running
+    assert calls == ["start"]
+
+
+async def test_paused_stops_and_resumes_scanning(calls):
+    """Scanning stops for the pause and resumes once the last pause ends."""
+    scanner = BLEScannerService()
+    await scanner.start()
+
+    async with scanner.paused():
+        async with scanner.paused():
+            assert calls == ["start", "stop"]
+        assert calls == ["start", "stop"]
+
+    assert calls == ["start", "stop", "start"]
+    assert scanner.is_running
+
+
+async def test_start_while_paused_waits_for_resume(calls):
+    """A scanner started during a pause only begins scanning afterwards."""
+    scanner = BLEScannerService()
+
+    async with scanner.paused():
+        await scanner.start()
+        assert calls == []
+
+    assert calls == ["start"]
@@ -0,0 +1,56 @@
+"""Tests for the BLE exploration write-pattern templates."""
+
+import pytest
+from ble_exploration.test_patterns import PatternType, compile_template, get_test_patterns
+
+
+def test_compile_template_expands_in_product_order():
+    """The first placeholder varies slowest; literals are kept as bytes."""
+    gen = compile_template(
+        "GET /<RESOURCE>/<ACTION>",
+        {"RESOURCE": [b"sif", b"stats"], "ACTION": [b"read", b"write"]},
+    )
+
+    assert list(gen()) == [
+        b"GET /sif/read",
+        b"GET /sif/write",
+        b"GET /stats/read",
+        b"GET /stats/write",
+    ]
+
+
+def test_compile_template_reuses_repeated_placeholder():
+    """A placeholder used twice takes the same value in both places."""
+    gen = compile_template("<X>-<X>", {"X": [b"a", b"b"]})
+
+    assert list(gen()) == [b"a-a", b"b-b"]
+
+
+def test_compile_template_without_placeholders():
+    """A literal template yields itself once; the generator can be rerun."""
+    gen = compile_template("AT", {})
+
+    assert list(gen()) == [b"AT"]
+    assert list(gen()) == [b"AT"]
+
+
+@pytest.mark.parametrize(
+    ("tmpl", "match"),
+    [
+        ("GET /<RESOURCE>", "No values for placeholder <RESOURCE>"),
+        ("GET /é", "Template must be ASCII"),
+    ],
+)
+def test_compile_template_rejects_bad_templates(tmpl, match):
+    """Unknown placeholders and non-ASCII templates are refused up front."""
+    with pytest.raises(ValueError, match=match):
+        compile_template(tmpl, {})
+
+
+def test_pattern_descriptions_match_payloads():
+    """Stored descriptions agree with the data they describe."""
+    for pattern in get_test_patterns():
+        if pattern.type is PatternType.BINARY:
+            assert pattern.description == f"Binary: {pattern.data.hex()}"
+        else:
+            assert pattern.description == pattern.data.decode("ascii")
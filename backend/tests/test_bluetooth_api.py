@@ -0,0 +1,68 @@
+"""Tests for the direct Bluetooth read endpoint."""
+
+import httpx
+import pytest
+
+from app.api.v1 import bluetooth
+from app.core.database import get_db
+from app.main import app
+
+EEPROM = bytes(range(256))
+
+
+class FakeBLEOperations:
+    """Stands in for BLEOperationsService, returning a fixed EEPROM image."""
+
+    def __init__(self, device_address: str):
+        self.device_address = device_address
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def read_eeprom(self, on_chunk=None) -> bytes:
+        if on_chunk:
+            on_chunk(EEPROM)
+        return EEPROM
+
+
+@pytest.fixture
+async def client(db_session, monkeypatch):
+    """HTTP client for the app, backed by the test session and a fake device."""
+    monkeypatch.setattr(bluetooth, "BLEOperationsService", FakeBLEOperations)
+
+    async def _get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = _get_db
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        yield http
+    app.dependency_overrides.pop(get_db)
+
+
+async def test_read_module_saves_new_module(client):
+    """A first read parses and saves the module."""
+    response = await client.post(
+        "/api/v1/bluetooth/read",
+        json={"device_address": "AA:BB:CC:DD:EE:FF", "name": "Optic"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Optic"
+
+
+async def test_read_module_rejects_duplicate_without_parsing(client, monkeypatch):
+    """Re-reading a saved module returns 409 before the data is parsed."""
+    body = {"device_address": "AA:BB:CC:DD:EE:FF", "name": "Optic"}
+    first = await client.post("/api/v1/bluetooth/read", json=body)
+    parsed = []
+    monkeypatch.setattr(bluetooth, "parse_sfp_data", parsed.append)
+
+    response = await client.post("/api/v1/bluetooth/read", json=body)
+
+    assert response.status_code == 409
+    assert f"ID: {first.json()['id']}" in response.json()["detail"]
+    assert parsed == []
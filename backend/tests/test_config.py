@@ -0,0 +1,36 @@
+"""Tests for settings parsing."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.config import Settings
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ('["SFP", "Wizard"]', ("SFP", "Wizard")),
+        ('"SFP"', ("SFP",)),
+        ("SFP", ("SFP",)),
+        ("SFP, Wizard,", ("SFP", "Wizard")),
+        ("", ("SFP", "Wizard")),
+        (["Optic"], ("Optic",)),
+    ],
+)
+def test_device_name_patterns_parsing(value, expected):
+    """Pattern strings become whole names, never single characters."""
+    assert Settings(device_name_patterns=value).device_name_patterns == expected
+
+
+@pytest.mark.parametrize("value", ["null", "5", '{"name": "SFP"}', None])
+def test_device_name_patterns_rejects_non_list(value):
+    """JSON that is neither a name nor a list is a clear settings error."""
+    with pytest.raises(ValidationError, match="device_name_patterns must be"):
+        Settings(device_name_patterns=value)
+
+
+def test_device_name_patterns_from_environment(monkeypatch):
+    """A comma-separated environment variable is accepted."""
+    monkeypatch.setenv("DEVICE_NAME_PATTERNS", "SFP,Wizard")
+
+    assert Settings().device_name_patterns == ("SFP", "Wizard")
@@ -0,0 +1,121 @@
+"""Tests for schema creation and migration."""
+
+import hashlib
+from datetime import datetime
+
+import pytest
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+    insert,
+    text,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import migrate
+from app.models.module import SFPModule
+
+# sfp_modules as created before the eeprom_256_bytes constraint existed
+_legacy_metadata = MetaData()
+_legacy_modules = Table(
+    "sfp_modules",
+    _legacy_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(255), nullable=False),
+    Column("vendor", String(100)),
+    Column("model", String(100)),
+    Column("serial", String(100)),
+    Column("eeprom_data", LargeBinary, nullable=False),
+    Column("sha256", String(64), unique=True, nullable=False, index=True),
+    Column("created_at", DateTime, nullable=False, default=datetime.utcnow),
+    Index("idx_vendor_model", "vendor", "model"),
+)
+
+
+def _row(name: str, eeprom: bytes) -> dict:
+    return {
+        "name": name,
+        "vendor": "ACME",
+        "model": "SFP-10G-LR",
+        "serial": "SN123",
+        "eeprom_data": eeprom,
+        "sha256": hashlib.sha256(eeprom).hexdigest(),
+    }
+
+
+@pytest.fixture
+async def conn():
+    """A connection to a fresh in-memory database."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as connection:
+        yield connection
+    await engine.dispose()
+
+
+async def _scalar(conn, sql: str):
+    return (await conn.execute(text(sql))).scalar()
+
+
+async def test_constraint_rejects_wrong_size_insert(db_session):
+    """A 255-byte image is refused by the database itself."""
+    with pytest.raises(IntegrityError, match="eeprom_256_bytes"):
+        await db_session.execute(insert(SFPModule).values(**_row("Short", bytes(255))))
+
+
+async def test_migrate_creates_current_schema(conn):
+    """A new database gets a table that only accepts 256-byte images."""
+    await migrate(conn)
+
+    await conn.execute(insert(SFPModule).values(**_row("Good", bytes(256))))
+    with pytest.raises(IntegrityError, match="eeprom_256_bytes"):
+        await conn.execute(insert(SFPModule).values(**_row("Short", bytes(255))))
+
+
+async def test_migrate_is_idempotent(conn):
+    """Running migrate on a current database keeps its rows."""
+    await migrate(conn)
+    await conn.execute(insert(SFPModule).values(**_row("Good", bytes(256))))
+
+    await migrate(conn)
+
+    assert await _scalar(conn, "SELECT count(*) FROM sfp_modules") == 1
+
+
+async def test_migrate_upgrades_legacy_table(conn):
+    """Pre-migration tables gain the constraint; wrong-size rows are set aside."""
+    await conn.run_sync(_legacy_metadata.create_all)
+    await conn.execute(
+        insert(_legacy_modules),
+        [_row("Good", bytes(256)), _row("Short", bytes(255))],
+    )
+
+    await migrate(conn)
+
+    names = (await conn.execute(text("SELECT name FROM sfp_modules"))).scalars().all()
+    assert names == ["Good"]
+    moved = (
+        await conn.execute(text("SELECT name FROM sfp_modules_invalid_eeprom"))
+    ).scalars().all()
+    assert moved == ["Short"]
+    indexes = set(
+        (
+            await conn.execute(
+                text(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type = 'index' AND tbl_name = 'sfp_modules'"
+                )
+            )
+        ).scalars()
+    )
+    assert {"ix_sfp_modules_sha256", "idx_vendor_model"} <= indexes
+
+    with pytest.raises(IntegrityError, match="eeprom_256_bytes"):
+        await conn.execute(insert(SFPModule).values(**_row("Short", bytes(255))))
+
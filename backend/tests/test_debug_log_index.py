@@ -0,0 +1,80 @@
+"""Tests for the incremental index over the debug exploration log."""
+
+import orjson
+import pytest
+
+from app.api.v1 import debug
+
+
+def _append(log_file, *entries: dict) -> None:
+    with open(log_file, "ab") as f:
+        for entry in entries:
+            f.write(orjson.dumps(entry) + b"\n")
+
+
+def _entry(event_type: str, n: int) -> dict:
+    return {"event_type": event_type, "data": {"n": n}}
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    """Point the debug API at an empty log with a fresh index."""
+    path = tmp_path / "ha_debug.jsonl"
+    monkeypatch.setattr(debug, "LOG_FILE", path)
+    monkeypatch.setattr(debug, "_log_offset", 0)
+    monkeypatch.setattr(debug, "_log_inode", None)
+    debug._log_index.clear()
+    yield path
+    debug._log_index.clear()
+
+
+async def test_index_picks_up_appended_entries(log_file):
+    """Entries appended after a read are returned by the next read."""
+    _append(log_file, _entry("write_test", 1), _entry("service_discovered", 1))
+    assert await debug._get_log_entries("write_test") == [_entry("write_test", 1)]
+
+    _append(log_file, _entry("write_test", 2))
+
+    assert await debug._get_log_entries("write_test") == [
+        _entry("write_test", 1),
+        _entry("write_test", 2),
+    ]
+    assert await debug._get_log_entries("service_discovered") == [
+        _entry("service_discovered", 1)
+    ]
+
+
+async def test_index_waits_for_partial_line(log_file):
+    """A line still being written is indexed once it is complete."""
+    line = orjson.dumps(_entry("write_test", 1))
+    log_file.write_bytes(line[:10])
+    assert await debug._get_log_entries("write_test") == []
+
+    with open(log_file, "ab") as f:
+        f.write(line[10:] + b"\n")
+
+    assert await debug._get_log_entries("write_test") == [_entry("write_test", 1)]
+
+
+async def test_index_rebuilt_after_truncation(log_file):
+    """Truncating the log drops the stale spans."""
+    _append(log_file, _entry("write_test", 1), _entry("write_test", 2))
+    assert len(await debug._get_log_entries("write_test")) == 2
+
+    log_file.write_bytes(b"")
+    _append(log_file, _entry("write_test", 3))
+
+    assert await debug._get_log_entries("write_test") == [_entry("write_test", 3)]
+
+
+async def test_index_rebuilt_after_rotation(log_file, tmp_path):
+    """A replacement log of the same size is re-indexed from the start."""
+    _append(log_file, _entry("write_test", 1))
+    assert await debug._get_log_entries("write_test") == [_entry("write_test", 1)]
+
+    rotated = tmp_path / "new.jsonl"
+    _append(rotated, _entry("scan_start", 1))
+    rotated.replace(log_file)
+
+    assert await debug._get_log_entries("write_test") == []
+    assert await debug._get_log_entries("scan_start") == [_entry("scan_start", 1)]
@@ -0,0 +1,204 @@
+"""Tests for the Home Assistant Bluetooth client."""
+
+import asyncio
+
+import orjson
+
+from app.services.ha_bluetooth import HomeAssistantBluetoothClient, ha_bluetooth_client
+from app.services.ha_bluetooth.schemas import HABluetoothDevice
+
+SFP_STATE = {
+    "entity_id": "device_tracker.sfp_wizard",
+    "last_changed": "2025-01-01T00:00:00+00:00",
+    "attributes": {
+        "friendly_name": "SFP Wizard",
+        "address": "aa:bb:cc:dd:ee:ff",
+        "source": "bluetooth",
+        "rssi": -60,
+    },
+}
+
+
+class FakeContent:
+    """aiohttp StreamReader stand-in that hands out the body in small reads."""
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def read(self, n: int = -1) -> bytes:
+        n = 16 if n < 0 else min(n, 16)
+        chunk, self._body = self._body[:n], self._body[n:]
+        return chunk
+
+
+class FakeResponse:
+    """Minimal aiohttp response: status and a streamed body."""
+
+    def __init__(self, body: bytes, status: int = 200):
+        self.status = status
+        self.content = FakeContent(body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """Serves queued responses."""
+
+    def __init__(self, *responses: FakeResponse):
+        self._responses = list(responses)
+
+    def get(self, url, timeout=None):
+        return self._responses.pop(0)
+
+
+def _client(session: FakeSession) -> HomeAssistantBluetoothClient:
+    client = HomeAssistantBluetoothClient(
+        ha_api_url="http://ha/api", supervisor_token="token", device_patterns=["SFP"]
+    )
+    client._session = session
+    return client
+
+
+async def test_discover_devices_parses_matching_entities():
+    """Bluetooth entities matching the name patterns are cached by MAC."""
+    body = orjson.dumps([SFP_STATE, {"entity_id": "light.kitchen", "attributes": {}}])
+    client = _client(FakeSession(FakeResponse(body)))
+
+    await client._discover_devices()
+
+    devices = await client.get_bluetooth_devices()
+    assert [(d.mac, d.name, d.rssi) for d in devices] == [
+        ("AA:BB:CC:DD:EE:FF", "SFP Wizard", -60)
+    ]
+    assert isinstance(devices, tuple)
+
+
+async def test_discover_devices_replaces_cache():
+    """Each discovery replaces the cache with the latest /states dump."""
+    renamed = {**SFP_STATE, "attributes": {**SFP_STATE["attributes"], "rssi": -40}}
+    client = _client(
+        FakeSession(
+            FakeResponse(orjson.dumps([SFP_STATE])),
+            FakeResponse(orjson.dumps([renamed])),
+        )
+    )
+    await client._discover_devices()
+
+    await client._discover_devices()
+
+    devices = await client.get_bluetooth_devices()
+    assert [d.rssi for d in devices] == [-40]
+
+
+async def test_discover_devices_keeps_cache_on_error_status():
+    """A failed /states request leaves the existing cache alone."""
+    client = _client(
+        FakeSession(FakeResponse(orjson.dumps([SFP_STATE])), FakeResponse(b"", status=502))
+    )
+    await client._discover_devices()
+
+    await client._discover_devices()
+
+    assert len(await client.get_bluetooth_devices()) == 1
+
+
+def _state_changed(rssi: int) -> dict:
+    attributes = {**SFP_STATE["attributes"], "rssi": rssi}
+    return {
+        "type": "event",
+        "event": {
+            "event_type": "state_changed",
+            "data": {
+                "entity_id": SFP_STATE["entity_id"],
+                "new_state": {**SFP_STATE, "attributes": attributes},
+            },
+        },
+    }
+
+
+async def test_websocket_updates_within_debounce_window_are_merged(monkeypatch):
+    """Several updates for one device inside the window cause a single flush."""
+    monkeypatch.setattr(ha_bluetooth_client, "_UPDATE_DEBOUNCE", 0.01)
+    client = _client(FakeSession())
+    flushes = []
+    flush = client._flush_pending_updates
+
+    def counting_flush():
+        flushes.append(dict(client._pending_updates))
+        flush()
+
+    client._flush_pending_updates = counting_flush
+
+    for rssi in (-70, -60, -50):
+        await client._handle_ws_message(_state_changed(rssi))
+    assert await client.get_bluetooth_devices() == ()
+
+    await asyncio.sleep(0.05)
+
+    assert len(flushes) == 1
+    assert len(flushes[0]) == 1
+    devices = await client.get_bluetooth_devices()
+    assert [d.rssi for d in devices] == [-50]
+
+
+async def test_stop_applies_pending_updates(monkeypatch):
+    """stop() cancels the debounce timer and applies what was waiting."""
+    monkeypatch.setattr(ha_bluetooth_client, "_UPDATE_DEBOUNCE", 60)
+    client = _client(FakeSession())
+    client._session = None
+    await client._handle_ws_message(_state_changed(-55))
+    handle = client._flush_handle
+
+    await client.stop()
+
+    assert handle.cancelled()
+    assert client._flush_handle is None
+    assert [d.rssi for d in client._discovered_devices.values()] == [-55]
+
+
+def _with_attributes(**attributes) -> dict:
+    return {
+        **SFP_STATE,
+        "entity_id": f"device_tracker.sfp_{len(attributes)}",
+        "attributes": {**SFP_STATE["attributes"], **attributes},
+    }
+
+
+async def test_discover_devices_skips_entities_that_violate_the_schema():
+    """Entities whose attributes do not fit HABluetoothDevice are not cached."""
+    body = orjson.dumps(
+        [
+            _with_attributes(address="11:11:11:11:11:11", rssi="strong"),
+            _with_attributes(address="22:22:22:22:22:22", friendly_name=42),
+            _with_attributes(address="33:33:33:33:33:33", source=7),
+            _with_attributes(address="44:44:44:44:44:44", rssi=-71.0),
+            SFP_STATE,
+        ]
+    )
+    client = _client(FakeSession(FakeResponse(body)))
+
+    await client._discover_devices()
+
+    devices = await client.get_bluetooth_devices()
+    assert sorted((d.mac, d.rssi) for d in devices) == [
+        ("44:44:44:44:44:44", -71),
+        ("AA:BB:CC:DD:EE:FF", -60),
+    ]
+    for device in devices:
+        HABluetoothDevice.model_validate(device.model_dump())
+
+
+async def test_websocket_update_with_invalid_rssi_is_ignored():
+    """A state_changed event with a non-numeric RSSI is not queued."""
+    client = _client(FakeSession())
+    event = _state_changed(-60)
+    event["event"]["data"]["new_state"]["attributes"]["rssi"] = "strong"
+
+    await client._handle_ws_message(event)
+
+    assert client._pending_updates == {}
+    assert client._flush_handle is None
@@ -0,0 +1,17 @@
+"""Tests for the logging setup."""
+
+import logging
+from logging.handlers import QueueHandler
+
+from app.core.logging import setup_logging, stop_logging
+
+
+def test_stop_logging_writes_directly_afterwards(capsys, restore_logging):
+    """Records logged after stop_logging() still reach stdout."""
+    setup_logging("INFO", json_logs=False)
+    stop_logging()
+
+    logging.getLogger("shutdown").warning("after listener stopped")
+
+    assert not any(isinstance(h, QueueHandler) for h in logging.getLogger().handlers)
+    assert "after listener stopped" in capsys.readouterr().out
@@ -0,0 +1,71 @@
+"""Tests for application startup and shutdown."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app import main
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor that remembers whether it was shut down."""
+
+    instances: list["RecordingExecutor"] = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.was_shut_down = False
+        self.instances.append(self)
+
+    def shutdown(self, *args, **kwargs) -> None:
+        self.was_shut_down = True
+        super().shutdown(*args, **kwargs)
+
+
+class FakeService:
+    """Service that records whether it was stopped."""
+
+    def __init__(self):
+        self.stopped = False
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+async def test_failed_startup_stops_started_services(monkeypatch, tmp_path, restore_logging):
+    """If the HA client fails to start, services that did start are stopped."""
+    scanner, backup = FakeService(), FakeService()
+
+    async def _init_db():
+        pass
+
+    async def _start_ha_bluetooth_client():
+        # Fail only after the other services have finished starting
+        await asyncio.sleep(0)
+        raise RuntimeError("HA unavailable")
+
+    async def _start_ble_scanner():
+        return scanner
+
+    async def _start_backup_service():
+        return backup
+
+    monkeypatch.setattr(main, "init_db", _init_db)
+    monkeypatch.setattr(main.settings, "submissions_dir", str(tmp_path / "submissions"))
+    monkeypatch.setattr(main, "_start_ha_bluetooth_client", _start_ha_bluetooth_client)
+    monkeypatch.setattr(main, "_start_ble_scanner", _start_ble_scanner)
+    monkeypatch.setattr(main, "_start_backup_service", _start_backup_service)
+    monkeypatch.setattr(main, "ThreadPoolExecutor", RecordingExecutor)
+    monkeypatch.setattr(RecordingExecutor, "instances", [])
+    # Keep the shared test loop's default executor usable by later tests
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(loop, "set_default_executor", lambda executor: None)
+
+    with pytest.raises(RuntimeError, match="HA unavailable"):
+        async with main.lifespan(main.app):
+            pass
+
+    assert scanner.stopped
+    assert backup.stopped
+    assert [executor.was_shut_down for executor in RecordingExecutor.instances] == [True]
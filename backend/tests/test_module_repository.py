@@ -0,0 +1,57 @@
+"""Tests for the SFP module repository."""
+
+import hashlib
+
+import pytest
+
+from app.repositories.module_repository import ModuleRepository
+
+
+def _module_fields(eeprom: bytes) -> dict:
+    return {
+        "name": "Test Module",
+        "vendor": "ACME",
+        "model": "SFP-10G-LR",
+        "serial": "SN123",
+        "eeprom_data": eeprom,
+        "sha256": hashlib.sha256(eeprom).hexdigest(),
+    }
+
+
+async def test_create_if_absent_inserts_new_module(db_session):
+    """A new checksum is inserted and reported as created."""
+    repo = ModuleRepository(db_session)
+
+    module, created = await repo.create_if_absent(**_module_fields(bytes(256)))
+
+    assert created is True
+    assert module.id is not None
+    assert module.eeprom_data == bytes(256)
+    assert module.created_at is not None
+
+
+async def test_create_if_absent_returns_existing_on_duplicate(db_session):
+    """A duplicate checksum returns the existing row without inserting."""
+    repo = ModuleRepository(db_session)
+    eeprom = bytes(range(256))
+
+    first, first_created = await repo.create_if_absent(**_module_fields(eeprom))
+    second, second_created = await repo.create_if_absent(
+        **{**_module_fields(eeprom), "name": "Other Name"}
+    )
+
+    assert first_created is True
+    assert second_created is False
+    assert second.id == first.id
+    assert second.name == "Test Module"
+    assert len(await repo.get_all()) == 1
+
+
+async def test_create_if_absent_rejects_wrong_size(db_session):
+    """EEPROM images that are not 256 bytes are rejected before insert."""
+    repo = ModuleRepository(db_session)
+
+    with pytest.raises(ValueError, match="must be 256 bytes, got 128"):
+        await repo.create_if_absent(**_module_fields(bytes(128)))
+
+    assert len(await repo.get_all()) == 0
@@ -0,0 +1,29 @@
+"""Tests for the rate-limit client key."""
+
+from starlette.requests import Request
+
+from app.core.rate_limit import client_key
+
+
+def _request(headers: dict[str, str], client: str = "172.30.32.2") -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+            "client": (client, 12345),
+        }
+    )
+
+
+def test_ingress_requests_are_keyed_by_user():
+    """Requests via the Supervisor proxy get one bucket per HA user."""
+    alice = _request({"X-Remote-User-Id": "abc"})
+    bob = _request({"X-Remote-User-Id": "def"})
+
+    assert client_key(alice) == "user:abc"
+    assert client_key(alice) != client_key(bob)
+
+
+def test_direct_requests_are_keyed_by_address():
+    """Without ingress headers the client address is the key."""
+    assert client_key(_request({}, client="192.168.1.20")) == "192.168.1.20"
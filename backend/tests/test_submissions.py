@@ -0,0 +1,84 @@
+"""Tests for writing community submissions into the inbox."""
+
+import base64
+import binascii
+import hashlib
+from datetime import UTC, datetime
+
+import orjson
+import pytest
+
+from app.api.v1 import submissions
+
+EEPROM = bytes(range(256))
+
+
+def _metadata() -> dict:
+    return {"name": "Optic", "sha256": None, "created_at": datetime(2025, 1, 1, tzinfo=UTC)}
+
+
+def test_persist_submission_publishes_entry(tmp_path):
+    """The entry appears under its inbox id with the data and metadata."""
+    sha = submissions._persist_submission(
+        str(tmp_path), "abc123", base64.b64encode(EEPROM).decode(), _metadata()
+    )
+
+    assert sha == hashlib.sha256(EEPROM).hexdigest()
+    assert [p.name for p in tmp_path.iterdir()] == ["abc123"]
+    entry = tmp_path / "abc123"
+    assert sorted(p.name for p in entry.iterdir()) == ["eeprom.bin", "metadata.json"]
+    assert (entry / "eeprom.bin").read_bytes() == EEPROM
+    assert orjson.loads((entry / "metadata.json").read_bytes()) == {
+        "name": "Optic",
+        "sha256": sha,
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+
+
+def test_persist_submission_removes_staging_on_failure(tmp_path, monkeypatch):
+    """A failed write leaves neither a staging nor a published entry."""
+
+    def failing_write(dir_fd, name, data):
+        if name == "metadata.json":
+            raise OSError("disk full")
+
+    monkeypatch.setattr(submissions, "_write_file_at", failing_write)
+
+    with pytest.raises(OSError, match="disk full"):
+        submissions._persist_submission(
+            str(tmp_path), "abc123", base64.b64encode(EEPROM).decode(), _metadata()
+        )
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_persist_submission_rejects_invalid_base64(tmp_path):
+    """Undecodable data fails before anything is written."""
+    with pytest.raises(binascii.Error):
+        submissions._persist_submission(str(tmp_path), "abc123", "é", _metadata())
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_persist_submission_syncs_before_publishing(tmp_path, monkeypatch):
+    """Both files and the staging dir are fsynced before the rename."""
+    events = []
+    fsync, rename = submissions.os.fsync, submissions.os.rename
+
+    def recording_fsync(fd):
+        events.append("fsync")
+        fsync(fd)
+
+    def recording_rename(src, dst):
+        events.append("rename")
+        rename(src, dst)
+
+    monkeypatch.setattr(submissions.os, "fsync", recording_fsync)
+    monkeypatch.setattr(submissions.os, "rename", recording_rename)
+
+    submissions._persist_submission(
+        str(tmp_path), "abc123", base64.b64encode(EEPROM).decode(), _metadata()
+    )
+
+    # eeprom.bin, metadata.json and the staging dir; then the inbox root
+    assert events == ["fsync", "fsync", "fsync", "rename", "fsync"]
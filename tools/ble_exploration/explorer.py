@@ -8,15 +8,46 @@ used by the SFP Wizard device.
 import asyncio
 import json
 import logging
-from datetime import datetime
+import os
+import time
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Sequence
 
 from bleak import BleakClient, BleakScanner
 from bleak.backends.characteristic import BleakGATTCharacteristic
 
+from .test_patterns import Pattern
+
 logger = logging.getLogger(__name__)
 
+# Log entries are written in batches of up to LOG_BATCH_SIZE, at most
+# LOG_FLUSH_INTERVAL seconds after the first entry of a batch was queued
+LOG_BATCH_SIZE = 64
+LOG_FLUSH_INTERVAL = 0.1
+
+
+def _timestamp_fields() -> Dict[str, Any]:
+    """
+    Current time as log fields: "timestamp" is the ISO-8601 UTC time readers
+    expect, "ts_ns" the same instant as integer epoch nanoseconds.
+    """
+    ns = time.time_ns()
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    timestamp = datetime.fromtimestamp(seconds, UTC).replace(
+        tzinfo=None, microsecond=remainder // 1000
+    )
+    return {"timestamp": timestamp.isoformat(), "ts_ns": ns}
+
+
+def _pattern_fields(pattern: Pattern) -> Dict[str, Any]:
+    """JSON-safe fields of a write pattern for the log (data as hex)."""
+    return {
+        "type": pattern.type.name.lower(),
+        "description": pattern.description,
+        "data_hex": pattern.data.hex(),
+    }
+
 
 class BLEExplorer:
     """BLE exploration and protocol analysis tool."""
@@ -31,19 +62,55 @@ class BLEExplorer:
         """
         self.device_address = device_address
         self.log_file = Path(log_file)
-        self.log_handle = open(self.log_file, 'a')
+        self._log_fd = os.open(self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        # Entries queued by _log_event; a background task writes them out in
+        # batches so logging never does file I/O on the event loop. A None
+        # entry tells the writer to flush and exit.
+        self._log_queue: asyncio.Queue[Dict[str, Any] | None] = asyncio.Queue()
+        self._log_writer: asyncio.Task | None = None
         self._client: BleakClient | None = None
 
     def _log_event(self, event_type: str, data: Dict[str, Any]) -> None:
-        """Log an event to the JSONL file."""
+        """Queue an event for the JSONL file."""
         entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            **_timestamp_fields(),
             "event_type": event_type,
             "device": self.device_address,
             "data": data
         }
-        self.log_handle.write(json.dumps(entry) + "\n")
-        self.log_handle.flush()
+        if self._log_writer is None:
+            self._log_writer = asyncio.create_task(self._write_log_batches())
+        self._log_queue.put_nowait(entry)
+
+    async def _write_log_batches(self) -> None:
+        """Write queued log entries in batches until a None entry arrives."""
+        loop = asyncio.get_running_loop()
+        done = False
+        while not done:
+            batch = []
+            entry = await self._log_queue.get()
+            deadline = loop.time() + LOG_FLUSH_INTERVAL
+            while entry is not None:
+                batch.append(entry)
+                if len(batch) >= LOG_BATCH_SIZE:
+                    break
+                try:
+                    entry = await asyncio.wait_for(
+                        self._log_queue.get(), deadline - loop.time()
+                    )
+                except asyncio.TimeoutError:
+                    break
+            done = entry is None
+
+            if batch:
+                data = "".join(json.dumps(e) + "\n" for e in batch).encode()
+                await asyncio.to_thread(self._write_all, data)
+
+    def _write_all(self, data: bytes) -> None:
+        """Append data to the log file (runs in thread pool)."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._log_fd, view):]
 
     async def connect(self, timeout: float = 30.0) -> None:
         """Connect to the BLE device."""
@@ -98,7 +165,7 @@ class BLEExplorer:
         logger.info(f"Discovered {len(services)} services")
         return services
 
-    async def test_write_patterns(self, patterns: List[Dict[str, Any]]) -> None:
+    async def test_write_patterns(self, patterns: Sequence[Pattern]) -> None:
         """
         Test multiple write patterns to discover protocol commands.
 
@@ -110,37 +177,37 @@ class BLEExplorer:
 
         logger.info(f"Testing {len(patterns)} write patterns...")
 
+        # Find the writable characteristic once; services don't change
+        # while connected
+        write_char = next(
+            (
+                char
+                for service in self._client.services
+                for char in service.characteristics
+                if "write" in char.properties
+            ),
+            None,
+        )
+        if not write_char:
+            logger.warning("No writable characteristic found")
+            self._log_event("write_test", {
+                "pattern_count": len(patterns),
+                "success": False,
+                "error": "No writable characteristic found"
+            })
+            return
+
         for i, pattern in enumerate(patterns):
             try:
-                # Find writable characteristic
-                write_char = None
-                for service in self._client.services:
-                    for char in service.characteristics:
-                        if "write" in char.properties:
-                            write_char = char
-                            break
-                    if write_char:
-                        break
-
-                if not write_char:
-                    self._log_event("write_test", {
-                        "pattern_index": i,
-                        "pattern": pattern,
-                        "success": False,
-                        "error": "No writable characteristic found"
-                    })
-                    continue
-
                 # Write pattern
-                data = pattern.get("data", b"")
-                await self._client.write_gatt_char(write_char, data)
+                await self._client.write_gatt_char(write_char, pattern.data)
 
                 # Wait for response
                 await asyncio.sleep(0.1)
 
                 self._log_event("write_test", {
                     "pattern_index": i,
-                    "pattern": pattern,
+                    "pattern": _pattern_fields(pattern),
                     "success": True,
                     "characteristic": write_char.uuid
                 })
@@ -148,7 +215,7 @@ class BLEExplorer:
             except Exception as e:
                 self._log_event("write_test", {
                     "pattern_index": i,
-                    "pattern": pattern,
+                    "pattern": _pattern_fields(pattern),
                     "success": False,
                     "error": str(e)
                 })
@@ -179,7 +246,7 @@ class BLEExplorer:
         def notification_handler(sender: BleakGATTCharacteristic, data: bytearray) -> None:
             """Handle incoming notifications."""
             notification = {
-                "timestamp": datetime.utcnow().isoformat(),
+                **_timestamp_fields(),
                 "characteristic": str(sender.uuid),
                 "data_hex": data.hex(),
                 "data_ascii": data.decode('utf-8', errors='replace'),
@@ -188,21 +255,25 @@ class BLEExplorer:
             notifications.append(notification)
             self._log_event("notification_received", notification)
 
-        # Start notifications on all notify-capable characteristics
-        notify_chars = []
-        for service in self._client.services:
-            for char in service.characteristics:
-                if "notify" in char.properties:
-                    await self._client.start_notify(char, notification_handler)
-                    notify_chars.append(char)
-                    logger.info(f"Started notifications on {char.uuid}")
+        # Start notifications on all notify-capable characteristics at once;
+        # each subscription is an independent round-trip to the BLE stack
+        notify_chars = [
+            char
+            for service in self._client.services
+            for char in service.characteristics
+            if "notify" in char.properties
+        ]
+        await asyncio.gather(
+            *(self._client.start_notify(char, notification_handler) for char in notify_chars)
+        )
+        for char in notify_chars:
+            logger.info(f"Started notifications on {char.uuid}")
 
         # Monitor for specified duration
         await asyncio.sleep(duration)
 
         # Stop notifications
-        for char in notify_chars:
-            await self._client.stop_notify(char)
+        await asyncio.gather(*(self._client.stop_notify(char) for char in notify_chars))
 
         self._log_event("monitoring_complete", {
             "duration": duration,
@@ -213,10 +284,17 @@ class BLEExplorer:
         logger.info(f"Captured {len(notifications)} notifications")
         return notifications
 
-    def close(self) -> None:
-        """Close the log file handle."""
-        if self.log_handle:
-            self.log_handle.close()
+    async def close(self) -> None:
+        """Flush queued log entries, then sync and close the log file."""
+        if self._log_fd < 0:
+            return
+        if self._log_writer is not None:
+            self._log_queue.put_nowait(None)
+            await self._log_writer
+            self._log_writer = None
+        await asyncio.to_thread(os.fsync, self._log_fd)
+        os.close(self._log_fd)
+        self._log_fd = -1
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -226,4 +304,4 @@ class BLEExplorer:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         await self.disconnect()
-        self.close()
+        await self.close()
@@ -5,46 +5,67 @@ This module provides common command patterns to test against
 BLE devices for protocol reverse engineering.
 """
 
-from typing import List, Dict, Any
+import re
+from collections.abc import Callable, Iterator, Sequence
+from enum import IntEnum
+from itertools import product
+from typing import Any, NamedTuple
 
+# Placeholder in a compile_template() template, e.g. "<RESOURCE>"
+_PLACEHOLDER_RE = re.compile(r"<(\w+)>")
 
-def get_test_patterns() -> List[Dict[str, Any]]:
+
+class PatternType(IntEnum):
+    """Pattern family; the lowercased name is used in logs."""
+
+    HTTP_COMMAND = 0
+    AT_COMMAND = 1
+    BINARY = 2
+
+
+class Pattern(NamedTuple):
     """
-    Get list of test patterns for protocol exploration.
+    A single write pattern to send to the device.
 
-    Returns:
-        List of test pattern dictionaries with data and metadata
+    description is the human-readable form used in logs. Patterns are built
+    once at import, so it is computed there rather than on every access.
     """
-    patterns = []
-
-    # HTTP-like commands (SFP Wizard protocol)
-    http_verbs = ["GET", "POST", "PUT", "DELETE", "PATCH"]
-    endpoints = [
-        "/",
-        "/api",
-        "/api/1.0",
-        "/api/1.0/version",
-        "/stats",
-        "/status",
-        "/sif",
-        "/sif/start",
-        "/sif/read",
-        "/sif/write",
-        "/sif/erase",
-        "/sif/status",
-    ]
-
-    for verb in http_verbs:
-        for endpoint in endpoints:
-            command = f"{verb} {endpoint}"
-            patterns.append({
-                "type": "http_command",
-                "data": command.encode('utf-8'),
-                "description": command
-            })
-
-    # Common protocol commands
-    common_commands = [
+
+    type: PatternType
+    data: bytes
+    description: str
+
+
+def _text_pattern(pattern_type: PatternType, data: bytes) -> Pattern:
+    """Pattern for an ASCII command, described by its decoded text."""
+    return Pattern(pattern_type, data, data.decode('ascii', 'replace'))
+
+
+def _iter_http_patterns() -> Iterator[Pattern]:
+    """Yield the HTTP-like commands (SFP Wizard protocol)."""
+    http_verbs = (b"GET", b"POST", b"PUT", b"DELETE", b"PATCH")
+    endpoints = (
+        b"/",
+        b"/api",
+        b"/api/1.0",
+        b"/api/1.0/version",
+        b"/stats",
+        b"/status",
+        b"/sif",
+        b"/sif/start",
+        b"/sif/read",
+        b"/sif/write",
+        b"/sif/erase",
+        b"/sif/status",
+    )
+
+    for verb, endpoint in product(http_verbs, endpoints):
+        yield _text_pattern(PatternType.HTTP_COMMAND, verb + b" " + endpoint)
+
+
+def _iter_at_patterns() -> Iterator[Pattern]:
+    """Yield the common protocol commands."""
+    common_commands = (
         b"AT",
         b"AT+",
         b"AT+VERSION",
@@ -56,31 +77,169 @@ def get_test_patterns() -> List[Dict[str, Any]]:
         b"START",
         b"STOP",
         b"INIT",
-    ]
+    )
 
     for cmd in common_commands:
-        patterns.append({
-            "type": "at_command",
-            "data": cmd,
-            "description": cmd.decode('utf-8')
-        })
-
-    # Binary patterns
-    binary_patterns = [
-        b"\x00",  # NULL
-        b"\x01",  # Start of heading
-        b"\x02",  # Start of text
-        b"\x03",  # End of text
-        b"\x04",  # End of transmission
-        b"\xFF",  # All bits set
-        b"\xAA\x55",  # Alternating bits
-    ]
-
-    for data in binary_patterns:
-        patterns.append({
-            "type": "binary",
-            "data": data,
-            "description": f"Binary: {data.hex()}"
-        })
-
-    return patterns
+        yield _text_pattern(PatternType.AT_COMMAND, cmd)
+
+
+def _iter_binary_patterns() -> Iterator[Pattern]:
+    """Yield the binary patterns."""
+    binary_patterns = (
+        (b"\x00", "Binary: 00"),  # NULL
+        (b"\x01", "Binary: 01"),  # Start of heading
+        (b"\x02", "Binary: 02"),  # Start of text
+        (b"\x03", "Binary: 03"),  # End of text
+        (b"\x04", "Binary: 04"),  # End of transmission
+        (b"\xFF", "Binary: ff"),  # All bits set
+        (b"\xAA\x55", "Binary: aa55"),  # Alternating bits
+    )
+
+    for data, description in binary_patterns:
+        yield Pattern(PatternType.BINARY, data, description)
+
+
+def _build_patterns() -> tuple[Pattern, ...]:
+    """Build the test patterns (runs once, at import)."""
+    return (
+        *_iter_http_patterns(),
+        *_iter_at_patterns(),
+        *_iter_binary_patterns(),
+    )
+
+
+def _build_trie(patterns: Sequence[Pattern]) -> dict[Any, Any]:
+    """
+    Build a byte-wise prefix trie over the HTTP and AT command patterns.
+
+    Each node maps a byte value to its child node; a node that ends a
+    command also maps the None key to that command's Pattern.
+    """
+    trie: dict[Any, Any] = {}
+    for pattern in patterns:
+        if pattern.type is PatternType.BINARY:
+            continue
+        node = trie
+        for byte in pattern.data:
+            node = node.setdefault(byte, {})
+        node[None] = pattern
+    return trie
+
+
+# Built once and shared: a tuple of NamedTuples, so it cannot be modified
+TEST_PATTERNS: tuple[Pattern, ...] = _build_patterns()
+_PATTERN_TRIE = _build_trie(TEST_PATTERNS)
+
+
+def get_test_patterns() -> tuple[Pattern, ...]:
+    """
+    Get test patterns for protocol exploration.
+
+    The patterns are built once at import; every call returns the same
+    immutable TEST_PATTERNS tuple.
+
+    Returns:
+        Tuple of test patterns with data and metadata
+    """
+    return TEST_PATTERNS
+
+
+def iter_test_patterns() -> Iterator[Pattern]:
+    """
+    Iterate over the test patterns one at a time.
+
+    For streaming consumers that send each pattern as it comes; the
+    patterns are already built, so nothing is allocated per pattern.
+
+    Returns:
+        Iterator over the same patterns as get_test_patterns()
+    """
+    return iter(TEST_PATTERNS)
+
+
+def get_pattern_trie() -> dict[Any, Any]:
+    """
+    Get the prefix trie over the HTTP and AT command patterns.
+
+    Built once at import alongside the patterns; callers must not modify it.
+
+    Returns:
+        Nested dict keyed by byte value, with None marking a complete command
+    """
+    return _PATTERN_TRIE
+
+
+def match_prefix(data: bytes) -> Pattern | None:
+    """
+    Find the longest HTTP or AT command pattern that data starts with.
+
+    Walks the trie one byte at a time, so the cost depends on the length
+    of the match rather than on the number of patterns.
+
+    Args:
+        data: Bytes received from (or sent to) the device
+
+    Returns:
+        The longest matching Pattern, or None if no command is a prefix
+    """
+    node = _PATTERN_TRIE
+    match = None
+    for byte in data:
+        node = node.get(byte)
+        if node is None:
+            break
+        match = node.get(None, match)
+    return match
+
+
+def compile_template(
+    tmpl: str, fields: dict[str, Sequence[bytes]]
+) -> Callable[[], Iterator[bytes]]:
+    """
+    Compile a command template into a generator of encoded variants.
+
+    Placeholders are written as <NAME>, e.g. "GET /api/1.0/<RESOURCE>/<ACTION>".
+    The template is turned into Python source with one nested loop per
+    placeholder and the literal fragments as bytes constants, so each
+    variant is a plain bytes concatenation with no formatting or encoding.
+    A placeholder used more than once takes the same value each time.
+
+    Args:
+        tmpl: ASCII template with <NAME> placeholders
+        fields: Values for each placeholder, already encoded
+
+    Returns:
+        Function returning an iterator over every expansion, in product
+        order (the first placeholder varies slowest)
+
+    Raises:
+        ValueError: If the template is not ASCII or uses an unknown placeholder
+    """
+    if not tmpl.isascii():
+        raise ValueError(f"Template must be ASCII: {tmpl!r}")
+
+    namespace: dict[str, Any] = {}
+    loop_vars: dict[str, str] = {}
+    terms = []
+    pos = 0
+    for match in _PLACEHOLDER_RE.finditer(tmpl):
+        name = match.group(1)
+        if name not in fields:
+            raise ValueError(f"No values for placeholder <{name}> in {tmpl!r}")
+        if match.start() > pos:
+            terms.append(repr(tmpl[pos:match.start()].encode('ascii')))
+        if name not in loop_vars:
+            loop_vars[name] = f"v{len(loop_vars)}"
+            namespace[f"FIELD{len(loop_vars) - 1}"] = tuple(fields[name])
+        terms.append(loop_vars[name])
+        pos = match.end()
+    if pos < len(tmpl) or not terms:
+        terms.append(repr(tmpl[pos:].encode('ascii')))
+
+    lines = ["def _gen():"]
+    for depth, var in enumerate(loop_vars.values()):
+        lines.append(f"{'    ' * (depth + 1)}for {var} in FIELD{depth}:")
+    lines.append(f"{'    ' * (len(loop_vars) + 1)}yield {' + '.join(terms)}")
+
+    exec(compile("\n".join(lines), f"<template {tmpl!r}>", "exec"), namespace)
+    return namespace["_gen"]